@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import agents
+import metrics
+from scoring import score_candidates
+from rate_limit import RateLimiter
+from llm import StubLLM
+
+JOB_DESCRIPTION = "Senior data engineer: 5+ years of Python and SQL, AWS, Docker, streaming pipelines."
+
+# Calls and Wall Time as More Short Resumes Share One Screening Call
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched structured screening against a stub LLM.")
+    parser.add_argument("--candidates", type=int, default=64)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--batch-tokens", type=int, default=4000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub LLM fixed latency per call in seconds")
+    parser.add_argument("--token-latency", type=float, default=0.05, help="Stub LLM seconds per 1000 prompt tokens")
+    parser.add_argument("--drop-rate", type=float, default=0.05, help="Share of batch entries the stub leaves out")
+    args = parser.parse_args()
+
+    candidates = [(f"cand-{i}", f"Experience:\nBuilt ETL jobs in Python for {i % 9 + 1} years\nSkills:\nSQL, AWS") for i in range(args.candidates)]
+
+    print(f"{'batch':>6} {'calls':>6} {'fallbacks':>10} {'seconds':>9} {'calls/s':>9} {'cands/s':>9} {'errors':>7}")
+    for batch_size in args.batch_sizes:
+        agents.client = stub = StubLLM(latency=args.latency, jitter=0.0, token_latency=args.token_latency, drop_rate=args.drop_rate)
+        agents.response_cache.enabled = False
+        agents.rate_limiter = RateLimiter(requests_per_minute=10 ** 6, tokens_per_minute=10 ** 9)
+        metrics.reset()
+        metrics.enable()
+
+        start = time.perf_counter()
+        results = list(score_candidates(JOB_DESCRIPTION, candidates, workers=args.workers, timeout=None, structured=True,
+                                        batch_size=batch_size, batch_tokens=args.batch_tokens))
+        elapsed = time.perf_counter() - start
+
+        fallbacks = sum(c["value"] for c in metrics.snapshot()["counters"] if c["name"] == "batch_fallbacks")
+        errors = sum(r["error"] is not None for r in results)
+        assert len(results) == len(candidates)
+        print(f"{batch_size:>6} {stub.calls:>6} {fallbacks:>10.0f} {elapsed:>9.2f} {stub.calls / elapsed:>9.1f} {len(results) / elapsed:>9.1f} {errors:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import os
+import re
+import sys
+import time
+import random
+import hashlib
+import argparse
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from candidates import build_candidate_table
+from corpus import FIRST_NAMES, LAST_NAMES, CITIES, VERBS, OBJECTS, SKILLS
+
+# Parsed (Intro, Body) Pairs Shaped Like the Parser's Output, Without Rendering PDFs
+def make_parsed(n, seed=0):
+    rng = random.Random(seed)
+    parsed, hashes = [], []
+    for i in range(n):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        intro = [{
+            "name": name,
+            "email": f"candidate{i}@example.com",
+            "mobile": f"+1{rng.randint(2000000000, 9899999999)}",
+            "websites": [f"github.com/candidate{i}"],
+            "location": rng.choice(CITIES),
+            "others": "Open to  relocation\t",
+        }]
+        experience = [f"{rng.choice(VERBS)}  {rng.choice(OBJECTS)} at Company {rng.randint(1, 99)}" for _ in range(rng.randint(3, 12))]
+        skills = [", ".join(rng.sample(SKILLS, 4))] if rng.random() < 0.7 else experience
+        body = [
+            {"criteria": "Education", "requirement": [f"BSc, University {rng.randint(1, 50)}"]},
+            {"criteria": "Experience", "requirement": experience},
+            {"criteria": "Skills", "requirement": skills},
+            {"criteria": "Others", "requirement": [f"Award {rng.randint(1, 999)}"]},
+        ]
+        parsed.append((intro, body))
+        hashes.append(hashlib.sha256(f"resume-{i}".encode()).hexdigest())
+    return parsed, hashes
+
+# The App's Previous Row-Wise Path
+def legacy_clean_text(text):
+    if not isinstance(text, str):
+        return ""
+    text = text.replace('\\n', '\n')
+    text = text.replace('\t', ' ')
+    text = re.sub(r' +', ' ', text)
+    text = re.sub(r'\n\s+', '\n', text)
+    return text.strip()
+
+def legacy_format_resume_row(row):
+    sections = []
+    for field in ["name", "email", "mobile", "websites", "location", "others"]:
+        if field in row and row[field] is not None and not (isinstance(row[field], float) and pd.isna(row[field])):
+            value = row[field]
+            if isinstance(value, (list, tuple)):
+                value = ", ".join(map(str, value))
+            cleaned = legacy_clean_text(str(value))
+            if cleaned.strip():
+                sections.append(f"**{field.title()}:** {cleaned}")
+    for section in ["Education", "Experience", "Skills", "Others"]:
+        if section in row and pd.notna(row[section]):
+            cleaned = legacy_clean_text(str(row[section]))
+            if cleaned.strip():
+                sections.append(f"\n### {section.title()}\n{cleaned}")
+    return "\n\n".join(sections)
+
+def legacy_table(parsed):
+    intro_rows = [item for intro, _ in parsed for item in intro]
+    body_rows = [{rec["criteria"]: "\n".join(rec["requirement"]) for rec in body} for _, body in parsed]
+    return pd.concat([pd.DataFrame(intro_rows), pd.DataFrame(body_rows)], axis=1)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the row-wise candidate table with the vectorised one.")
+    parser.add_argument("--candidates", type=int, default=10000)
+    parser.add_argument("--selections", type=int, default=200, help="Interview-page candidate selections to time")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    parsed, hashes = make_parsed(args.candidates, args.seed)
+    rng = random.Random(args.seed)
+
+    # Legacy: concat, iterrows + string concat for scoring, filter + format per selection
+    start = time.perf_counter()
+    old = legacy_table(parsed)
+    old_build = time.perf_counter() - start
+    start = time.perf_counter()
+    old_texts = [(idx, row["Education"] + "\n" + row["Experience"] + "\n" + row["Skills"] + "\n" + row["Others"]) for idx, row in old.iterrows()]
+    old_scoring = time.perf_counter() - start
+    picks = [old.at[rng.randrange(len(old)), "name"] for _ in range(args.selections)]
+    start = time.perf_counter()
+    for name in picks:
+        legacy_format_resume_row(old[old["name"] == name].iloc[0])
+    old_select = (time.perf_counter() - start) / args.selections
+
+    # Vectorised table with precomputed text columns
+    start = time.perf_counter()
+    table = build_candidate_table(parsed, hashes)
+    new_build = time.perf_counter() - start
+    start = time.perf_counter()
+    new_texts = list(zip(table.index, table["resume_text"]))
+    new_scoring = time.perf_counter() - start
+    ids = [table.index[rng.randrange(len(table))] for _ in range(args.selections)]
+    start = time.perf_counter()
+    for cid in ids:
+        table.at[cid, "profile_text"]
+    new_select = (time.perf_counter() - start) / args.selections
+
+    expected = [legacy_format_resume_row(row) for _, row in old.iterrows()]
+    mismatches = sum(e != a for e, a in zip(expected, table["profile_text"]))
+
+    print(f"candidates: {args.candidates}")
+    print(f"{'step':<28} {'row-wise':>12} {'vectorised':>12}")
+    print(f"{'build table (s)':<28} {old_build:>12.3f} {new_build:>12.3f}")
+    print(f"{'scoring texts (s)':<28} {old_scoring:>12.3f} {new_scoring:>12.3f}")
+    print(f"{'select + format (ms)':<28} {old_select * 1000:>12.3f} {new_select * 1000:>12.3f}")
+    print(f"profile_text mismatches vs format_resume_row: {mismatches}")
+    if mismatches or len(new_texts) != len(old_texts):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
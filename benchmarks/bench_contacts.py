@@ -0,0 +1,119 @@
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from resume_parser import scan_contacts
+from corpus import FIRST_NAMES, LAST_NAMES, CITIES, SKILLS
+
+SUMMARY_LINES = [
+    "Software engineer with 8 years of experience building data platforms",
+    "Open to relocation and remote roles",
+    "Certified Kubernetes Administrator (CKA), AWS Solutions Architect",
+    "Portfolio and writing available on request",
+    "Singapore PR | Available from March 2025",
+    "Languages: English, Mandarin, Malay",
+]
+
+# Header Lines as Previous Releases Scanned Them: Two Loops, Patterns Rebuilt per Call
+def legacy_email(text):
+    email_content = re.findall("([^@|\\s]+@[^@]+\\.[^@|\\s]+)", text)
+    if email_content:
+        try:
+            return email_content[0].split()[0].strip(';')
+        except IndexError:
+            return None
+
+def legacy_mobile(text):
+    mobile_no = re.findall(re.compile(
+        r'(?:(?:\+?([1-9]|[0-9][0-9]|[0-9][0-9][0-9])\s*(?:[.-]\s*)?)?(?:\(\s*([2-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9])\s*\)|([0-9][1-9]|[0-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9]))\s*(?:[.-]\s*)?)?([2-9]1[02-9]|[2-9][02-9]1|[2-9][02-9]{2})\s*(?:[.-]\s*)?([0-9]{4})(?:\s*(?:#|x\.?|ext\.?|extension)\s*(\d+))?'),
+        text)
+    if mobile_no:
+        temp_number = ''.join(mobile_no[0])
+        if len(temp_number) > 10:
+            return '+' + temp_number
+        else:
+            return temp_number
+
+def legacy_websites(text):
+    pattern = r'\b(?:https?:\/\/)?(?:www\.)?[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:\/[^\s]*)?\b'
+    return re.findall(pattern, text)
+
+def legacy_scan(resume_header):
+    consumed = set()
+    email = mobile = None
+    for item in resume_header:
+        if not email and legacy_email(item):
+            email = legacy_email(item)
+            consumed.add(item)
+        if not mobile and legacy_mobile(item):
+            mobile = legacy_mobile(item)
+            consumed.add(item)
+        if email and mobile:
+            break
+
+    websites = []
+    email_domains = ['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com', 'aol.com', '.edu']
+    for item in resume_header:
+        site = legacy_websites(item)
+        if site:
+            legit = [w for w in site if not any(d in w for d in email_domains)]
+            if legit:
+                websites.extend(legit)
+                consumed.add(item)
+    return email, mobile, websites, consumed
+
+# Headers of 6-20 Lines: Contact Details in Varied Layouts Plus Summary Text
+def make_header(rng):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    email = f"{first.lower()}.{last.lower()}@{rng.choice(['gmail.com', 'example.com', 'uni.edu'])}"
+    phone = rng.choice([
+        f"+1 {rng.randint(201, 989)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        f"({rng.randint(201, 989)}) {rng.randint(200, 999)} {rng.randint(1000, 9999)}",
+        f"+65 {rng.randint(8000, 9999)} {rng.randint(1000, 9999)}",
+    ])
+    links = [f"linkedin.com/in/{first.lower()}-{last.lower()}", f"https://github.com/{first.lower()}{rng.randint(1, 99)}"]
+    contact = [email, phone] + links
+    if rng.random() < 0.5:
+        contact = [" | ".join(contact)]
+    rest = [rng.choice(CITIES)] + contact
+    rest += rng.sample(SUMMARY_LINES, rng.randint(1, len(SUMMARY_LINES)))
+    rest += [", ".join(rng.sample(SKILLS, 5)) for _ in range(rng.randint(0, 6))]
+    rng.shuffle(rest)
+    return [f"{first} {last}"] + rest
+
+def main():
+    parser = argparse.ArgumentParser(description="Check scan_contacts against the legacy two-loop scan and compare headers/s.")
+    parser.add_argument("--headers", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    headers = [make_header(rng) for _ in range(args.headers)]
+
+    re.purge()
+    start = time.perf_counter()
+    expected = [legacy_scan(header) for header in headers]
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [scan_contacts(header) for header in headers]
+    single = time.perf_counter() - start
+
+    mismatches = [(h, e, a) for h, e, a in zip(headers, expected, actual) if e != a]
+    lines = sum(len(h) for h in headers)
+    print(f"headers: {len(headers)}, mean lines per header: {lines / len(headers):.1f}")
+    print(f"legacy scan:    {len(headers) / legacy:>10.0f} headers/s")
+    print(f"scan_contacts:  {len(headers) / single:>10.0f} headers/s ({legacy / single:.1f}x)")
+    print(f"mismatches:     {len(mismatches):>10}")
+    for header, e, a in mismatches[:10]:
+        print(f"  {header!r}\n    legacy: {e!r}\n    single: {a!r}")
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
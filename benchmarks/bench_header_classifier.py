@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+import random
+import string
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from resume_parser import HeaderClassifier, normalize_header, eng_taxonomy, flat_list_eng
+
+FILLER_WORDS = (
+    "the project manager lead data python sql team summary profile contact references "
+    "volunteer intern achievements publications languages interests objective"
+).split()
+
+# Regression Corpus: Noisy Taxonomy Synonyms, Ordinary Resume Lines and Random Strings
+def make_corpus(n, seed=0):
+    rng = random.Random(seed)
+    synonyms = [syn for syn, _ in flat_list_eng]
+    lines = []
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.3:
+            chars = list(rng.choice(synonyms))
+            for _ in range(rng.randint(0, 3)):
+                chars[rng.randrange(len(chars))] = rng.choice(string.ascii_lowercase + " ")
+            line = "".join(chars)
+            line = line.upper() if rng.random() < 0.5 else line.title()
+        elif r < 0.8:
+            line = " ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(1, 4)))
+        else:
+            line = "".join(rng.choice(string.ascii_letters + " ") for _ in range(rng.randint(0, 30)))
+        lines.append(line)
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description="Check HeaderClassifier against normalize_header and compare lines/s.")
+    parser.add_argument("--lines", type=int, default=5000)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.lines, args.seed)
+
+    start = time.perf_counter()
+    expected = [normalize_header(line, eng_taxonomy, flat_list_eng, args.threshold) for line in corpus]
+    legacy = time.perf_counter() - start
+
+    # Fresh classifier so the cache starts cold
+    classifier = HeaderClassifier(eng_taxonomy)
+    start = time.perf_counter()
+    actual = [classifier.classify(line, args.threshold) for line in corpus]
+    compiled = time.perf_counter() - start
+
+    mismatches = [(line, e, a) for line, e, a in zip(corpus, expected, actual) if e != a]
+    print(f"normalize_header:  {len(corpus) / legacy:>10.0f} lines/s")
+    print(f"HeaderClassifier:  {len(corpus) / compiled:>10.0f} lines/s ({legacy / compiled:.1f}x)")
+    print(f"mismatches:        {len(mismatches):>10}")
+    for line, e, a in mismatches[:10]:
+        print(f"  {line!r}: expected {e}, got {a}")
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Time a Statement in a Fresh Interpreter
+def time_fresh(statement):
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+# Import-Time Benchmark for the Modules the App Loads at Start-Up
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of the parsing module.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=None, help="Exit non-zero if the median import exceeds this")
+    args = parser.parse_args()
+
+    cases = {
+        "import resume_parser": "import resume_parser",
+        "first get_nlp()": "import resume_parser; resume_parser.get_nlp()",
+    }
+    medians = {}
+    for label, statement in cases.items():
+        samples = [time_fresh(statement) for _ in range(args.repeat)]
+        medians[label] = statistics.median(samples)
+        print(f"{label:<22} median {medians[label]:.3f}s  min {min(samples):.3f}s  max {max(samples):.3f}s")
+
+    if args.max_seconds is not None and medians["import resume_parser"] > args.max_seconds:
+        print(f"import regression: {medians['import resume_parser']:.3f}s > {args.max_seconds:.3f}s")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+
+import pypdfium2 as pdfium
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from resume_parser import parse_pdf, iter_pdf_lines, HEADER_MAX_PAGES
+from synthetic_pdf import make_pdf
+
+WORDS = "led built shipped designed scaled python data pipeline team customers revenue latency platform api".split()
+
+# Previous Implementation: Whole-Document String, Handles Left to the Garbage Collector
+def legacy_parse_pdf(resume):
+    pdf = pdfium.PdfDocument(resume)
+    text_final = ""
+    for i in range(len(pdf)):
+        page = pdf[i]
+        textpage = page.get_textpage()
+        text_final += textpage.get_text_range()
+    return text_final.split("\r\n")
+
+# Synthetic Multi-Page Portfolio CVs
+def make_corpus(n_docs, n_pages, lines_per_page=48, seed=0):
+    rng = random.Random(seed)
+    return [
+        make_pdf([
+            [" ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12))) for _ in range(lines_per_page)]
+            for _ in range(n_pages)
+        ])
+        for _ in range(n_docs)
+    ]
+
+def measure(fn, corpus):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = [fn(doc) for doc in corpus]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory and throughput of page-wise PDF text extraction.")
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 20, 50])
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'path':<14} {'pages/s':>10} {'peak KiB':>10}")
+    for n_pages in args.pages:
+        corpus = make_corpus(args.docs, n_pages)
+        total_pages = args.docs * n_pages
+
+        expected, legacy_time, legacy_peak = measure(legacy_parse_pdf, corpus)
+        actual, stream_time, stream_peak = measure(parse_pdf, corpus)
+        if actual != expected:
+            sys.exit(f"parse_pdf output differs from the legacy extractor at {n_pages} pages")
+
+        # Header detection only needs the first pages, and a streaming consumer never holds the list
+        _, header_time, header_peak = measure(lambda doc: list(iter_pdf_lines(doc, HEADER_MAX_PAGES)), corpus)
+        _, lazy_time, lazy_peak = measure(lambda doc: sum(1 for _ in iter_pdf_lines(doc)), corpus)
+
+        for label, elapsed, peak, pages in [
+            ("legacy", legacy_time, legacy_peak, total_pages),
+            ("parse_pdf", stream_time, stream_peak, total_pages),
+            ("iter (lazy)", lazy_time, lazy_peak, total_pages),
+            ("header only", header_time, header_peak, args.docs * min(n_pages, HEADER_MAX_PAGES)),
+        ]:
+            print(f"{n_pages:>6} {label:<14} {pages / elapsed:>10.0f} {peak / 1024:>10.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import agents
+from ranking import prefilter_candidates
+from scoring import score_candidates
+from rate_limit import RateLimiter
+from llm import StubLLM
+
+SKILLS = ["python", "sql", "aws", "docker", "kubernetes", "react", "java", "spark", "tableau", "excel",
+          "figma", "salesforce", "go", "rust", "pytorch", "airflow", "terraform", "node.js", "c++", "scala"]
+JOB_DESCRIPTION = "Data engineer building pipelines in Python, SQL, Spark and Airflow on AWS with Docker and Terraform."
+
+# Synthetic Candidate Pool with Random Skill Mixes
+def make_pool(n, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        skills = rng.sample(SKILLS, rng.randint(3, 8))
+        rows.append({
+            "name": f"Candidate {i}",
+            "Education": rng.choice(["BSc Computer Science", "BA Economics", "MSc Data Science", "BEng Mechanical"]),
+            "Experience": f"Worked {rng.randint(1, 12)} years using " + ", ".join(skills),
+            "Skills": " ".join(skills),
+        })
+    return pd.DataFrame(rows)
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM call volume and wall time with and without the local prefilter.")
+    parser.add_argument("--pools", type=int, nargs="+", default=[50, 200, 1000, 5000])
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub LLM latency per call in seconds")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    agents.response_cache.enabled = False
+    agents.rate_limiter = RateLimiter(requests_per_minute=10 ** 6, tokens_per_minute=10 ** 9)
+
+    print(f"{'pool':>6} {'calls':>7} {'prefilter s':>12} {'two-stage s':>12} {'all-LLM s (est)':>16}")
+    for n in args.pools:
+        pool = make_pool(n)
+
+        start = time.perf_counter()
+        ranked = prefilter_candidates(JOB_DESCRIPTION, pool, top_k=args.top_k)
+        prefilter_time = time.perf_counter() - start
+
+        shortlist = [(idx, pool.at[idx, "Experience"]) for idx in ranked.index[ranked["selected"]]]
+        agents.client = StubLLM(latency=args.latency)
+        start = time.perf_counter()
+        list(score_candidates(JOB_DESCRIPTION, shortlist, workers=args.workers, timeout=None))
+        two_stage = prefilter_time + time.perf_counter() - start
+
+        # Scoring the whole pool takes ceil(n / workers) rounds of stub latency
+        all_llm = -(-n // args.workers) * args.latency
+        print(f"{n:>6} {len(shortlist):>7} {prefilter_time:>12.3f} {two_stage:>12.2f} {all_llm:>16.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import agents
+import metrics
+from scoring import score_candidates
+from rate_limit import RateLimiter
+from llm import StubLLM
+
+JOB_DESCRIPTION = "\n".join(
+    f"Requirement {i}: experience with distributed systems, Python, SQL and cloud infrastructure." for i in range(40)
+)
+
+# Shared Prompt Prefix Across a Scoring Batch, Against a Stub That Caches Prefixes Like the Provider
+def main():
+    parser = argparse.ArgumentParser(description="Check the screening prompt prefix is identical across candidates and report cached tokens.")
+    parser.add_argument("--candidates", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub LLM latency per uncached call in seconds")
+    args = parser.parse_args()
+
+    agents.response_cache.enabled = False
+    agents.rate_limiter = RateLimiter(requests_per_minute=10 ** 6, tokens_per_minute=10 ** 9)
+    agents.client = stub = StubLLM(latency=args.latency, jitter=0.0, prefix_cache=True)
+    candidates = [(i, f"Experience:\nCandidate {i} built data pipelines for {i + 1} years") for i in range(args.candidates)]
+
+    metrics.reset()
+    metrics.enable()
+    start = time.perf_counter()
+    results = list(score_candidates(JOB_DESCRIPTION, candidates, workers=args.workers, timeout=None, structured=True))
+    elapsed = time.perf_counter() - start
+
+    counters = {c["name"]: c["value"] for c in metrics.snapshot()["counters"] if c["stage"] == "resume_screening_structured"}
+    prompt_tokens = counters.get("prompt_tokens", 0)
+    cached_tokens = counters.get("cached_prompt_tokens", 0)
+    distinct = len(set(stub.prefixes))
+    print(f"calls:               {stub.calls:>10}")
+    print(f"errors:              {sum(r['error'] is not None for r in results):>10}")
+    print(f"distinct prefixes:   {distinct:>10}")
+    print(f"prompt tokens:       {prompt_tokens:>10.0f}")
+    print(f"cached prefix tokens:{cached_tokens:>10.0f} ({cached_tokens / max(1, prompt_tokens):.0%})")
+    print(f"wall seconds:        {elapsed:>10.2f}")
+    if distinct != 1:
+        print("prefix differs between candidates")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
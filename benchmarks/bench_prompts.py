@@ -0,0 +1,61 @@
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from resume_parser import parse_resumes
+from prompts import resume_payload, compact_inputs
+from rate_limit import estimate_tokens
+from corpus import make_corpus
+import metrics
+
+JOB_DESCRIPTION = """
+## **Senior Data Engineer**
+
+We are a fast-growing startup building    the next generation of hiring tools.
+
+**Responsibilities**
+- Design and   operate batch and streaming data pipelines
+- Own our data warehouse and its SQL models
+- Design and   operate batch and streaming data pipelines
+
+**Qualifications**
+- 5+ years of Python and SQL
+- Experience with AWS, Docker and Kubernetes
+"""
+
+# Prompt Input Tokens Before and After Compaction on the Synthetic Corpus
+def main():
+    parser = argparse.ArgumentParser(description="Measure screening prompt input tokens before and after compaction.")
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.resumes, seed=args.seed, pages=tuple(args.pages))
+    parsed = parse_resumes([pdf for pdf, _ in corpus])
+
+    metrics.reset()
+    metrics.enable()
+    for _, body in parsed:
+        record = {rec["criteria"]: "\n".join(rec["requirement"]) for rec in body}
+        # The payload the scoring page used to send: sections joined as they are
+        legacy = "\n".join(record[section] for section in ["Education", "Experience", "Skills", "Others"])
+        compact_inputs(JOB_DESCRIPTION, legacy, agent="legacy")
+        metrics.count("input_tokens_raw", estimate_tokens(JOB_DESCRIPTION) + estimate_tokens(legacy), stage="payload")
+        compact_inputs(JOB_DESCRIPTION, resume_payload(record), agent="payload")
+
+    counters = {(c["name"], c["stage"]): c["value"] for c in metrics.snapshot()["counters"]}
+    raw = counters[("input_tokens_raw", "payload")]
+    legacy_compact = counters[("input_tokens_compact", "legacy")]
+    compact = counters[("input_tokens_compact", "payload")]
+    n = len(parsed)
+    print(f"resumes: {n}")
+    print(f"{'input':<34} {'tokens/call':>12} {'saved':>8}")
+    print(f"{'JD + joined sections (before)':<34} {raw / n:>12.0f} {'':>8}")
+    print(f"{'compact JD + joined sections':<34} {legacy_compact / n:>12.0f} {1 - legacy_compact / raw:>8.0%}")
+    print(f"{'compact JD + resume_payload':<34} {compact / n:>12.0f} {1 - compact / raw:>8.0%}")
+
+if __name__ == "__main__":
+    main()
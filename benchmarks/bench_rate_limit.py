@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import threading
+from collections import deque
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import agents
+from rate_limit import RateLimiter, acall_with_backoff
+
+# Error Shaped Like the Provider's 429 Response
+class ThrottleError(Exception):
+    def __init__(self, retry_after):
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+        self.response = SimpleNamespace(status_code=429, headers={"retry-after": str(retry_after)})
+
+# Fake LLM Enforcing a Sliding One-Second Request Window, Like a Provider Would
+class ThrottlingLLM:
+    def __init__(self, per_second, latency=0.02):
+        self.per_second = per_second
+        self.latency = latency
+        self.window = deque()
+        self.lock = threading.Lock()
+        self.ok = 0
+        self.rejected = 0
+
+    def _admit(self):
+        with self.lock:
+            now = time.monotonic()
+            while self.window and now - self.window[0] > 1.0:
+                self.window.popleft()
+            if len(self.window) >= self.per_second:
+                self.rejected += 1
+                raise ThrottleError(retry_after=0.2)
+            self.window.append(now)
+            self.ok += 1
+
+    def invoke(self, messages, **kwargs):
+        self._admit()
+        time.sleep(self.latency)
+        return SimpleNamespace(content="ok")
+
+    async def ainvoke(self, messages, **kwargs):
+        self._admit()
+        await asyncio.sleep(self.latency)
+        return SimpleNamespace(content="ok")
+
+def run_threads(args):
+    fake = ThrottlingLLM(args.provider_rps)
+    agents.client = fake
+    agents.rate_limiter = RateLimiter(requests_per_minute=args.limiter_rps * 60, tokens_per_minute=10 ** 9)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(lambda i: agents.resume_screening_agent("JD", f"resume {i}"), range(args.calls)))
+    return fake, agents.rate_limiter, len(results), time.perf_counter() - start
+
+def run_asyncio(args):
+    fake = ThrottlingLLM(args.provider_rps)
+    limiter = RateLimiter(requests_per_minute=args.limiter_rps * 60, tokens_per_minute=10 ** 9)
+
+    async def main():
+        calls = [acall_with_backoff(lambda: fake.ainvoke([]), limiter) for _ in range(args.calls)]
+        return await asyncio.gather(*calls)
+
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    return fake, limiter, len(results), time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the shared rate limiter against a fake LLM that returns 429s.")
+    parser.add_argument("--calls", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--provider-rps", type=int, default=8, help="Requests per second the fake provider accepts")
+    parser.add_argument("--limiter-rps", type=int, default=12, help="Configured limiter rate, set above the provider's to force 429s")
+    args = parser.parse_args()
+
+    agents.response_cache.enabled = False
+    for label, run in [("threads", run_threads), ("asyncio", run_asyncio)]:
+        fake, limiter, completed, elapsed = run(args)
+        print(f"{label:<8} completed {completed}/{args.calls} in {elapsed:.2f}s ({completed / elapsed:.1f} req/s), "
+              f"{fake.rejected} 429s, final rate scale {limiter.scale:.2f}")
+        if completed != args.calls or fake.ok != args.calls:
+            sys.exit(f"{label}: some calls were lost")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import agents
+from scoring import score_candidates
+from rate_limit import RateLimiter
+from llm import StubLLM
+
+# Throughput of the Batch Scoring Engine as Concurrency Grows
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent candidate scoring against a stub LLM.")
+    parser.add_argument("--candidates", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub LLM latency per call in seconds")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    candidates = [(i, f"Candidate {i} resume text") for i in range(args.candidates)]
+
+    print(f"{'workers':>8} {'seconds':>10} {'cands/s':>10} {'speedup':>10}")
+    baseline = None
+    for workers in args.workers:
+        agents.client = StubLLM(latency=args.latency)
+        agents.response_cache.enabled = False
+        agents.rate_limiter = RateLimiter(requests_per_minute=10 ** 6, tokens_per_minute=10 ** 9)
+        start = time.perf_counter()
+        results = list(score_candidates("Stub job description", candidates, workers=workers, timeout=None))
+        elapsed = time.perf_counter() - start
+
+        failed = sum(r["error"] is not None for r in results)
+        if failed:
+            print(f"warning: {failed} candidates failed at workers={workers}")
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.2f} {len(results) / elapsed:>10.1f} {baseline / elapsed:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import agents
+import metrics
+from cache import ResponseCache
+from rate_limit import RateLimiter, estimate_tokens
+from resume_parser import parse_pdf, numbered_lines, parse_resumes_batch, SECTION_FALLBACK_WORKERS
+from corpus import make_resume, _content_lines, FIRST_NAMES, LAST_NAMES, CITIES
+from synthetic_pdf import make_pdf
+from llm import StubLLM
+
+# Section Titles Outside the Parser's Taxonomy
+UNRECOGNISED_TITLES = {"experience": "WHAT I HAVE DONE", "education": "WHERE I STUDIED", "skills": "TOOLBOX", "others": "EXTRAS"}
+
+def make_unrecognised(rng, lines_per_section=8):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [name, f"{name.split()[0].lower()}@example.com", rng.choice(CITIES)]
+    for cat, title in UNRECOGNISED_TITLES.items():
+        lines.append(title)
+        lines.extend(_content_lines(cat, rng, lines_per_section))
+    return make_pdf([lines])
+
+# Lines That Reached a Section Instead of the Intro (Skills Can Be a Copy of Experience, So It Is Left Out)
+def body_lines(results):
+    return sum(len(rec["requirement"]) for _, body in results for rec in body if rec["criteria"] != "Skills") / len(results)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the confidence-gated LLM section fallback against a stub LLM.")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--unrecognised", type=float, default=0.2, help="Share of resumes with off-taxonomy section titles")
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub LLM latency per call in seconds")
+    parser.add_argument("--workers", type=int, default=SECTION_FALLBACK_WORKERS, help="Concurrent fallback calls")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pdfs = [make_unrecognised(rng) if rng.random() < args.unrecognised else make_resume(rng)[0] for _ in range(args.resumes)]
+    agents.rate_limiter = RateLimiter(requests_per_minute=10 ** 6, tokens_per_minute=10 ** 9)
+    metrics.enable()
+
+    start = time.perf_counter()
+    rule_based = parse_resumes_batch(pdfs, workers=1)
+    rule_seconds = time.perf_counter() - start
+
+    print(f"resumes: {args.resumes}, stub latency {args.latency}s")
+    print(f"{'run':<24} {'seconds':>8} {'llm calls':>10} {'fallbacks':>10} {'body lines':>11}")
+    print(f"{'rules only':<24} {rule_seconds:>8.2f} {0:>10} {0:>10} {body_lines(rule_based):>11.1f}")
+
+    agents.response_cache = ResponseCache(path=":memory:")
+    metrics.reset()
+    runs = [("fallback, 1 worker", 1), (f"fallback, {args.workers} workers", args.workers), ("fallback, cached", args.workers)]
+    for label, workers in runs:
+        if label != "fallback, cached":
+            agents.response_cache.clear()
+        agents.client = stub = StubLLM(latency=args.latency, jitter=0.0)
+        stats = {}
+        start = time.perf_counter()
+        results = parse_resumes_batch(pdfs, workers=1, llm_fallback=True, fallback_workers=workers, stats=stats)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<24} {elapsed:>8.2f} {stub.calls:>10} {stats['low_confidence']:>10} {body_lines(results):>11.1f}")
+
+    # Payload: Compact Numbered Lines Out and Indices Back, Versus the Old List Repr with the Text Echoed
+    lines = parse_pdf(make_unrecognised(random.Random(args.seed)))
+    titles = set(UNRECOGNISED_TITLES.values())
+    headers = [(idx, item, "others") for idx, item in enumerate(lines) if item in titles]
+    header, body = lines[: headers[0][0]], lines[headers[0][0] :]
+    old_in, new_in = estimate_tokens(str(lines)), estimate_tokens(numbered_lines(lines))
+    old_out = estimate_tokens(json.dumps({"resume_header": header, "resume_body": body, "resume_body_headers": [h[1] for h in headers]}))
+    new_out = estimate_tokens(json.dumps({"body_start": len(header), "headers": [{"line": h[0], "section": h[2]} for h in headers]}))
+    print(f"tokens per resume, old list repr / numbered lines: input {old_in} / {new_in}, reply {old_out} / {new_out}")
+    counters = {c["name"]: c["value"] for c in metrics.snapshot()["counters"] if c["stage"] == "parse"}
+    print(f"fallback rate: {counters.get('section_fallbacks', 0) / counters['resumes_parsed']:.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from resume_parser import eng_taxonomy
+from synthetic_pdf import make_pdf
+
+FIRST_NAMES = ["Alice", "Bruno", "Chen", "Divya", "Emeka", "Fatima", "Gareth", "Hana", "Ivan", "Julia", "Kofi", "Lena"]
+LAST_NAMES = ["Tan", "Okafor", "Schmidt", "Nakamura", "Fernandes", "Kowalski", "Lim", "Haddad", "Moreau", "Silva"]
+CITIES = ["Singapore", "London", "Berlin", "Toronto", "Sydney", "Mumbai", "Austin", "Nairobi"]
+VERBS = ["Led", "Built", "Shipped", "Designed", "Scaled", "Migrated", "Automated", "Mentored"]
+OBJECTS = ["data pipelines", "a payments API", "the search service", "ML models", "a design system", "CI/CD"]
+SKILLS = ["Python", "SQL", "AWS", "Docker", "Kubernetes", "React", "Java", "Spark", "Tableau", "Terraform"]
+
+# Section Headers Are Drawn from the Taxonomy the Parser Itself Uses
+SECTION_SYNONYMS = {cat: [syn for syn in syns] for cat, syns in eng_taxonomy.items()}
+
+def _style(text, rng):
+    return rng.choice([text.upper(), text.title(), text])
+
+def _content_lines(cat, rng, n):
+    if cat == "experience":
+        return [f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} at Company {rng.randint(1, 99)} ({rng.randint(2010, 2024)})" for _ in range(n)]
+    if cat == "education":
+        return [f"BSc Computer Science, University {rng.randint(1, 50)}, {rng.randint(2005, 2022)}" for _ in range(n)]
+    if cat == "skills":
+        return [", ".join(rng.sample(SKILLS, 4)) + f" ({rng.randint(1, 9)} yrs)" for _ in range(n)]
+    return [f"Award {rng.randint(1, 999)} for {rng.choice(OBJECTS)}" for _ in range(n)]
+
+# One Synthetic Resume and the Ground Truth the Parser Should Recover
+def make_resume(rng, n_pages=1, lines_per_page=40):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    name = f"{first} {last}"
+    email = f"{first.lower()}.{last.lower()}{rng.randint(1, 99)}@example.com"
+    area, exchange, line = rng.randint(201, 989), rng.randint(200, 999), rng.randint(1000, 9999)
+    phone = f"+1 {area}-{exchange}-{line}"
+    website = f"github.com/{first.lower()}{last.lower()}"
+    location = rng.choice(CITIES)
+
+    # Layouts: stacked contact lines, or one pipe-separated contact line
+    if rng.random() < 0.5:
+        header = [name, email, phone, location, website]
+    else:
+        header = [name, f"{email} | {phone} | {website}", location]
+
+    categories = rng.sample(list(SECTION_SYNONYMS), rng.randint(2, len(SECTION_SYNONYMS)))
+    body_budget = max(len(categories) * 3, n_pages * lines_per_page - len(header))
+    per_section = max(2, body_budget // len(categories) - 1)
+
+    lines = list(header)
+    sections = []
+    for cat in categories:
+        title = _style(rng.choice(SECTION_SYNONYMS[cat]), rng)
+        content = _content_lines(cat, rng, per_section)
+        sections.append({"category": cat, "header": title, "lines": content})
+        lines.append(title)
+        lines.extend(content)
+
+    # pdfium joins the last line of a page to the first line of the next, so no header sits at a page break
+    section_titles = {s["header"] for s in sections}
+    pages, page = [], []
+    for text in lines:
+        if len(page) >= lines_per_page and text not in section_titles and page[-1] not in section_titles:
+            pages.append(page)
+            page = []
+        page.append(text)
+    pages.append(page)
+    truth = {
+        "name": name,
+        "email": email,
+        "mobile_digits": f"1{area}{exchange}{line}",
+        "websites": [website],
+        "location": location,
+        "sections": sections,
+        "pages": len(pages),
+    }
+    return make_pdf(pages), truth
+
+def make_corpus(n, seed=0, pages=(1, 2, 3)):
+    rng = random.Random(seed)
+    return [make_resume(rng, n_pages=rng.choice(pages)) for _ in range(n)]
@@ -0,0 +1,176 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import metrics
+from resume_parser import parse_resumes, get_nlp
+from corpus import make_corpus
+from llm import StubLLM
+
+PARSING_STAGES = ["parse_pdf", "extract_sections", "normalize_header", "header_ner",
+                  "extract_personal_information", "extract_resume_body"]
+
+def _digits(value):
+    return "".join(ch for ch in str(value or "") if ch.isdigit())
+
+# Field-Level Accuracy of Parsed Resumes Against the Corpus Ground Truth
+def accuracy(results, truths):
+    hits = {"name": 0, "email": 0, "mobile": 0, "websites": 0, "location": 0, "sections": 0}
+    n_sections = 0
+    for (intro, body), truth in zip(results, truths):
+        info = intro[0]
+        hits["name"] += info["name"] == truth["name"]
+        hits["email"] += info["email"] == truth["email"]
+        hits["mobile"] += _digits(info["mobile"]) == truth["mobile_digits"]
+        hits["websites"] += all(site in (info["websites"] or []) for site in truth["websites"])
+        hits["location"] += info["location"] == truth["location"]
+
+        # A section counts when its header and every line land under the right category
+        by_category = {rec["criteria"].lower(): rec["requirement"] for rec in body}
+        for section in truth["sections"]:
+            n_sections += 1
+            extracted = by_category.get(section["category"], [])
+            text = "\n".join(extracted)
+            if section["header"] in extracted and all(line in text for line in section["lines"]):
+                hits["sections"] += 1
+
+    n = max(1, len(truths))
+    return {
+        **{field: hits[field] / n for field in ["name", "email", "mobile", "websites", "location"]},
+        "sections": hits["sections"] / max(1, n_sections),
+    }
+
+# Stage Timings and Accuracy at Each Corpus Size
+def bench_parsing(sizes, seed):
+    get_nlp()
+    runs = []
+    for size in sizes:
+        corpus = make_corpus(size, seed=seed)
+        pdfs = [pdf for pdf, _ in corpus]
+        truths = [truth for _, truth in corpus]
+
+        metrics.reset()
+        metrics.enable()
+        start = time.perf_counter()
+        results = parse_resumes(pdfs)
+        elapsed = time.perf_counter() - start
+        stages = metrics.snapshot()["stages"]
+        metrics.enable(False)
+
+        runs.append({
+            "resumes": size,
+            "pages": sum(truth["pages"] for truth in truths),
+            "wall_seconds": elapsed,
+            "resumes_per_second": size / elapsed,
+            "stages": {stage: stages[stage] for stage in PARSING_STAGES if stage in stages},
+            "accuracy": accuracy(results, truths),
+        })
+        print(f"parsing  {size:>6} resumes  {size / elapsed:>8.1f} resumes/s  "
+              f"sections {runs[-1]['accuracy']['sections']:.0%}  email {runs[-1]['accuracy']['email']:.0%}", file=sys.stderr)
+    return runs
+
+# Agent Throughput and Time to First Token Against the Stub LLM
+def bench_agents(latency, candidates, workers_list):
+    import agents
+    from scoring import score_candidates
+    from rate_limit import RateLimiter
+
+    agents.response_cache.enabled = False
+    agents.rate_limiter = RateLimiter(requests_per_minute=10 ** 6, tokens_per_minute=10 ** 9)
+
+    scoring = []
+    pool = [(i, f"Candidate {i} resume") for i in range(candidates)]
+    for workers in workers_list:
+        agents.client = StubLLM(latency=latency)
+        start = time.perf_counter()
+        results = list(score_candidates("Stub JD", pool, workers=workers, timeout=None, structured=True))
+        elapsed = time.perf_counter() - start
+        scoring.append({
+            "workers": workers,
+            "candidates": candidates,
+            "wall_seconds": elapsed,
+            "calls_per_second": candidates / elapsed,
+            "errors": sum(r["error"] is not None for r in results),
+        })
+        print(f"scoring  {workers:>6} workers  {candidates / elapsed:>8.1f} calls/s", file=sys.stderr)
+
+    agents.client = StubLLM(latency=latency)
+    start = time.perf_counter()
+    agents.job_description_agent("Stub role")
+    blocking = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stream = agents.job_description_agent_stream("Stub role")
+    next(stream)
+    first_token = time.perf_counter() - start
+    for _ in stream:
+        pass
+
+    return {
+        "stub_latency_seconds": latency,
+        "scoring": scoring,
+        "job_description": {"blocking_seconds": blocking, "stream_first_token_seconds": first_token},
+    }
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+# Throughput Change per Corpus Size Against an Earlier Results File
+def compare(results, baseline):
+    before = {run["resumes"]: run for run in baseline.get("parsing", [])}
+    print(f"{'resumes':>8} {'before/s':>10} {'after/s':>10} {'change':>8}")
+    for run in results["parsing"]:
+        old = before.get(run["resumes"])
+        if old is None:
+            continue
+        change = run["resumes_per_second"] / old["resumes_per_second"] - 1
+        print(f"{run['resumes']:>8} {old['resumes_per_second']:>10.1f} {run['resumes_per_second']:>10.1f} {change:>+8.0%}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the parsing and agent benchmark suite and write the results as JSON.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub LLM latency per call in seconds")
+    parser.add_argument("--candidates", type=int, default=32)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--skip-agents", action="store_true")
+    parser.add_argument("--out", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_results.json"),
+                        help="Results file, benchmarks/bench_results.json by default (git-ignored)")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare parsing throughput against")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "seed": args.seed,
+        },
+        "parsing": bench_parsing(args.sizes, args.seed),
+    }
+    if not args.skip_agents:
+        results["agents"] = bench_agents(args.latency, args.candidates, args.workers)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"wrote {args.out}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,165 @@
 import os
+import json
+import time
+import itertools
 from typing import List, Dict
 
-# Langchain and Groq imports
-from langchain_groq import ChatGroq
+# Langchain imports
 from langchain_core.messages import SystemMessage, HumanMessage
 
-# Initialize the Groq client using environment variable
-client = ChatGroq(
-    model_name="llama-3.3-70b-versatile",
-    temperature=0.7
-)
+import llm
+import metrics
+from cache import ResponseCache, cache_key
+from rate_limit import RateLimiter, call_with_backoff, estimate_tokens, DEFAULT_COMPLETION_TOKENS
+from prompts import compact_inputs, compact_batch_inputs
 
-def job_description_agent(basic_description) -> str:
+# A Reply That Arrived but Cannot Be Used; Asking Again May Help, Unlike Most Other Errors
+class MalformedReply(ValueError):
+    pass
+
+# Each Agent Gets Its Task's Client from the Backend; Assigning a Client Here Overrides Them All
+client = None
+
+# Agent -> Backend Task, Which Picks the Model
+AGENT_TASKS = {
+    "job_description": "job_description",
+    "resume_screening": "screening",
+    "resume_screening_structured": "screening",
+    "resume_screening_batch": "screening",
+    "interview_question": "interview",
+    "resume_sections": "sections",
+}
+
+def client_for(agent):
+    return client if client is not None else llm.get_client(AGENT_TASKS.get(agent, agent))
+
+# System Prompts
+JOB_DESCRIPTION_SYSTEM = "You are an expert Job Architect for startups."
+RESUME_SCREENING_SYSTEM = "You are an expert at evaluating people's capabilities."
+INTERVIEW_QUESTION_SYSTEM = "You are an expert in crafting interview questions. "
+
+# Structured Screening Output
+SCREENING_MAX_TOKENS = 300
+
+# Appended When a Stream Is Cut Short by max_seconds
+STREAM_STOPPED_NOTE = "\n\n*Generation stopped: time limit reached.*"
+
+# Persistent Response Cache Shared by All Agents
+response_cache = ResponseCache()
+
+# One Limiter for Every Agent Call in the Process
+rate_limiter = RateLimiter()
+
+# A Prompt Is One User Message, or a Sequence Sent as Consecutive User Messages
+def _prompt_parts(prompt):
+    return [prompt] if isinstance(prompt, str) else list(prompt)
+
+# Stable Prefix First (System, Then Shared Context), Per-Call Suffix Last
+def _messages(system_prompt, prompt):
+    return [SystemMessage(content=system_prompt)] + [HumanMessage(content=part) for part in _prompt_parts(prompt)]
+
+def _request_tokens(system_prompt, prompt, params):
+    prompt_tokens = sum(estimate_tokens(part) for part in _prompt_parts(prompt))
+    return estimate_tokens(system_prompt) + prompt_tokens + params.get("max_tokens", DEFAULT_COMPLETION_TOKENS)
+
+# Prompt Tokens the Provider Served from Its Prefix Cache, in Either Reporting Shape
+def _cached_tokens(response):
+    details = (getattr(response, "usage_metadata", None) or {}).get("input_token_details") or {}
+    if details.get("cache_read"):
+        return details["cache_read"]
+    token_usage = (getattr(response, "response_metadata", None) or {}).get("token_usage") or {}
+    return (token_usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+
+# Token Usage Reported by the Provider, Counted per Agent
+def _record_usage(agent, usage, call=True, cached=0):
+    if call:
+        metrics.count("llm_calls", stage=agent)
+    if usage:
+        metrics.count("prompt_tokens", usage.get("input_tokens", 0), stage=agent)
+        metrics.count("completion_tokens", usage.get("output_tokens", 0), stage=agent)
+    if cached:
+        metrics.count("cached_prompt_tokens", cached, stage=agent)
+
+def _cache_key(chat_client, system_prompt, prompt, **params):
+    return cache_key(
+        getattr(chat_client, "model_name", type(chat_client).__name__),
+        getattr(chat_client, "temperature", None),
+        system_prompt,
+        prompt,
+        **params,
+    )
+
+# Invoke the Client, Serving Repeated Prompts from the Cache
+# cache_id, when given, stands in for the prompt in the cache key; timeout (seconds) bounds the HTTP request
+def _invoke(system_prompt, prompt, use_cache=True, agent="", cache_id=None, timeout=None, **params):
+    chat_client = client_for(agent)
+    key = _cache_key(chat_client, system_prompt, prompt if cache_id is None else cache_id, **params)
+    if use_cache:
+        cached = response_cache.get(key)
+        if cached is not None:
+            metrics.count("cache_hits", stage=agent)
+            return cached
+
+    messages = _messages(system_prompt, prompt)
+    request = params if timeout is None else {**params, "timeout": timeout}
+    start = time.perf_counter()
+    response = call_with_backoff(
+        lambda: chat_client.invoke(messages, **request),
+        rate_limiter,
+        tokens=_request_tokens(system_prompt, prompt, params),
+    )
+    _record_usage(agent, getattr(response, "usage_metadata", None), cached=_cached_tokens(response))
+    response_cache.set(key, response.content, time.perf_counter() - start)
+    return response.content
+
+# Stream the Response Chunk by Chunk, Stopping Early Once max_seconds Has Passed
+def _stream(system_prompt, prompt, use_cache=True, max_seconds=None, agent=""):
+    chat_client = client_for(agent)
+    key = _cache_key(chat_client, system_prompt, prompt)
+    if use_cache:
+        cached = response_cache.get(key)
+        if cached is not None:
+            metrics.count("cache_hits", stage=agent)
+            yield cached
+            return
+
+    messages = _messages(system_prompt, prompt)
+    start = time.perf_counter()
+    parts = []
+
+    # Throttling surfaces when the first chunk is requested, so that is what gets retried
+    def open_stream():
+        stream = chat_client.stream(messages)
+        try:
+            return stream, next(stream, None)
+        except BaseException:
+            stream.close()
+            raise
+
+    stream, first = call_with_backoff(open_stream, rate_limiter, tokens=_request_tokens(system_prompt, prompt, {}))
+    if metrics.is_enabled():
+        metrics.record(f"agent.{agent}.first_token", time.perf_counter() - start)
+    try:
+        for chunk in itertools.chain([first] if first is not None else [], stream):
+            _record_usage(agent, getattr(chunk, "usage_metadata", None), call=False, cached=_cached_tokens(chunk))
+            if chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+            if max_seconds is not None and time.perf_counter() - start > max_seconds:
+                yield STREAM_STOPPED_NOTE
+                return
+    finally:
+        # Closing the stream also drops the HTTP response when the consumer cancels
+        stream.close()
+        # The request was made either way, even if it was cut short by a cancel, an error or max_seconds
+        metrics.count("llm_calls", stage=agent)
+
+    # Only complete generations are cached
+    if metrics.is_enabled():
+        metrics.record(f"agent.{agent}.stream", time.perf_counter() - start)
+    response_cache.set(key, "".join(parts), time.perf_counter() - start)
+
+def _job_description_prompt(basic_description):
     prompt = (
         f"""
         Basic Description: {basic_description}
@@ -24,90 +172,227 @@ def job_description_agent(basic_description) -> str:
         5.  Suggest 3-5 key "soft skills" that would indicate a strong cultural fit for this role and startup.
         """
     )
-    messages = [
-        SystemMessage(content="You are an expert Job Architect for startups."),
-        HumanMessage(content=prompt)
-    ]
-    response = client.invoke(messages)
-    return response.content
+    return prompt
 
-def resume_screening_agent(job_description, candidate_resume):
-        
-    prompt = (
-        f"""
-        Instructions:
-        1. Analyze the Job Description:
-            - Identify hard requirements (e.g., skills, certifications, experience).
-            - Identify soft requirements (e.g., teamwork, leadership).
-            - Note any preferred qualifications (bonus points).
-
-        2. Analyze the Candidate’s Resume:
-            - Extract relevant skills, experience, and achievements.
-            - Highlight quantifiable accomplishments (e.g., "increased sales by 20%").
-            - Note any gaps (missing requirements).
-
-        3. Match & Score (0-100):
-            - Compare the candidate’s qualifications against the job requirements.
-            - Assign weights to critical requirements (e.g., "5+ years of Python" = 30% of score).
-            - Deduct points for missing hard requirements; award bonus points for preferred qualifications.
-            
-        4. Output Structure:
-            - Match Score: Integer from 0 to 100.
-            
-        Example Output:
-        {{
-            "Score": 88/100,
-            " Strengths":  [
-                7 years of Python (matches "5+ years" requirement), 
-                Led a team of 5 (matches leadership requirement)
-            ]
-            "Weaknesses": [
-                No AWS certification (listed as preferred),
-            ]
-            "Recommendation": "Strong fit for the role."
-        }}
-            
-        Job Description: 
-        {job_description}
-        
-        Candidate Resume:
-        {candidate_resume}
-        """
-    )
-    messages = [
-        SystemMessage(content="You are an expert at evaluating people's capabilities."),
-        HumanMessage(content=prompt)
-    ]
-    response = client.invoke(messages)
-    return response.content
+@metrics.timed("agent.job_description")
+def job_description_agent(basic_description, use_cache=True) -> str:
+    return _invoke(JOB_DESCRIPTION_SYSTEM, _job_description_prompt(basic_description), use_cache=use_cache, agent="job_description")
 
-def interview_question_agent(job_description, candidate_resume):
-        
-    prompt = (
-        f"""
-        Instructions:
-        1.  Use the Job Description to identify key competencies and responsibilities.
-        2.  Review the resume review to understand the candidate's strengths and weaknesses.
-        3.  Ensure that questions related to Work Experience are specific to the candidate's past roles and accomplishments as described in their resume, and relevant to the requirements of the job description.
-        4.  Generate 7-10 high-quality interview questions that probe areas of strength, address potential weaknesses, and align with the interviewer's focus.
-        5.  Ensure questions are open-ended and encourage detailed responses.
-        6.  Avoid generic questions. Make them specific to the context provided, including insights from the resume review.
-            
-        Example Output:
-        1. As a highly motivated problem solver with excellent interpersonal and communication skills, can you describe a situation where you had to communicate complex technical ideas to a non-technical audience? 
-        2. How do you stay up-to-date with the latest developments in the field of GenAI technology, and how do you see these technologies evolving in the future?"
-        ```
-            
-        Job Description: 
-        {job_description}
-        
-        Candidate Resume:
-        {candidate_resume}
-        """
-    )
-    messages = [
-        SystemMessage(content="You are an expert in crafting interview questions. "),
-        HumanMessage(content=prompt)
+def job_description_agent_stream(basic_description, use_cache=True, max_seconds=None):
+    return _stream(JOB_DESCRIPTION_SYSTEM, _job_description_prompt(basic_description), use_cache=use_cache, max_seconds=max_seconds, agent="job_description")
+
+# Fixed Instructions Live in the System Message, So Every Call Shares the Same Leading Bytes
+RESUME_SCREENING_INSTRUCTIONS = """Instructions:
+1. Analyze the Job Description:
+    - Identify hard requirements (e.g., skills, certifications, experience).
+    - Identify soft requirements (e.g., teamwork, leadership).
+    - Note any preferred qualifications (bonus points).
+
+2. Analyze the Candidate’s Resume:
+    - Extract relevant skills, experience, and achievements.
+    - Highlight quantifiable accomplishments (e.g., "increased sales by 20%").
+    - Note any gaps (missing requirements).
+
+3. Match & Score (0-100):
+    - Compare the candidate’s qualifications against the job requirements.
+    - Assign weights to critical requirements (e.g., "5+ years of Python" = 30% of score).
+    - Deduct points for missing hard requirements; award bonus points for preferred qualifications.
+
+4. Output Structure:
+    - Match Score: Integer from 0 to 100.
+
+Example Output:
+{
+    "Score": 88/100,
+    " Strengths":  [
+        7 years of Python (matches "5+ years" requirement),
+        Led a team of 5 (matches leadership requirement)
     ]
-    response = client.invoke(messages)
-    return response.content
\ No newline at end of file
+    "Weaknesses": [
+        No AWS certification (listed as preferred),
+    ]
+    "Recommendation": "Strong fit for the role."
+}"""
+
+STRUCTURED_SCREENING_INSTRUCTIONS = """Score how well the candidate fits the job, from 0 to 100.
+Weigh hard requirements most, deduct for missing ones and add for preferred qualifications.
+
+Reply with only a JSON object, no prose:
+{"score": <integer 0-100>, "strengths": [<up to 3 short phrases>], "weaknesses": [<up to 3 short phrases>], "recommendation": "<one short sentence>"}"""
+
+INTERVIEW_QUESTION_INSTRUCTIONS = """Instructions:
+1.  Use the Job Description to identify key competencies and responsibilities.
+2.  Review the resume review to understand the candidate's strengths and weaknesses.
+3.  Ensure that questions related to Work Experience are specific to the candidate's past roles and accomplishments as described in their resume, and relevant to the requirements of the job description.
+4.  Generate 7-10 high-quality interview questions that probe areas of strength, address potential weaknesses, and align with the interviewer's focus.
+5.  Ensure questions are open-ended and encourage detailed responses.
+6.  Avoid generic questions. Make them specific to the context provided, including insights from the resume review.
+
+Example Output:
+1. As a highly motivated problem solver with excellent interpersonal and communication skills, can you describe a situation where you had to communicate complex technical ideas to a non-technical audience?
+2. How do you stay up-to-date with the latest developments in the field of GenAI technology, and how do you see these technologies evolving in the future?"""
+
+# System Message, Then the Per-Requisition JD, Then the Per-Candidate Resume
+def _candidate_prompt(persona, instructions, job_description, candidate_resume, agent):
+    job_description, candidate_resume = compact_inputs(job_description, candidate_resume, agent=agent)
+    system_prompt = f"{persona.strip()}\n\n{instructions}"
+    return system_prompt, (f"Job Description:\n{job_description}", f"Candidate Resume:\n{candidate_resume}")
+
+def _resume_screening_prompt(job_description, candidate_resume):
+    return _candidate_prompt(RESUME_SCREENING_SYSTEM, RESUME_SCREENING_INSTRUCTIONS, job_description, candidate_resume, "resume_screening")
+
+@metrics.timed("agent.resume_screening")
+def resume_screening_agent(job_description, candidate_resume, use_cache=True, timeout=None):
+    system_prompt, prompt = _resume_screening_prompt(job_description, candidate_resume)
+    return _invoke(system_prompt, prompt, use_cache=use_cache, agent="resume_screening", timeout=timeout)
+
+def resume_screening_agent_stream(job_description, candidate_resume, use_cache=True, max_seconds=None):
+    system_prompt, prompt = _resume_screening_prompt(job_description, candidate_resume)
+    return _stream(system_prompt, prompt, use_cache=use_cache, max_seconds=max_seconds, agent="resume_screening")
+
+def _structured_screening_prompt(job_description, candidate_resume):
+    return _candidate_prompt(RESUME_SCREENING_SYSTEM, STRUCTURED_SCREENING_INSTRUCTIONS, job_description, candidate_resume, "resume_screening_structured")
+
+# Validate a Structured Screening Reply and Normalise Its Fields
+def parse_screening_result(text) -> Dict:
+    try:
+        data = json.loads(text)
+    except (TypeError, json.JSONDecodeError) as e:
+        raise MalformedReply(f"Screening reply is not valid JSON: {text!r}") from e
+    return _screening_fields(data, text)
+
+def _screening_fields(data, text) -> Dict:
+    if not isinstance(data, dict):
+        raise MalformedReply(f"Screening reply is not a JSON object: {text!r}")
+
+    score = data.get("score")
+    if isinstance(score, str) and score.strip().isdigit():
+        score = int(score.strip())
+    if isinstance(score, float) and score.is_integer():
+        score = int(score)
+    if not isinstance(score, int) or isinstance(score, bool) or not 0 <= score <= 100:
+        raise MalformedReply(f"Screening reply has no integer score between 0 and 100: {text!r}")
+
+    def as_list(value):
+        if isinstance(value, str):
+            return [value] if value.strip() else []
+        if isinstance(value, list):
+            return [str(item) for item in value]
+        return []
+
+    return {
+        "score": score,
+        "strengths": as_list(data.get("strengths")),
+        "weaknesses": as_list(data.get("weaknesses")),
+        "recommendation": str(data.get("recommendation") or ""),
+    }
+
+# JSON-Mode Screening with a Small Completion Budget
+@metrics.timed("agent.resume_screening_structured")
+def resume_screening_agent_structured(job_description, candidate_resume, use_cache=True, timeout=None) -> Dict:
+    system_prompt, prompt = _structured_screening_prompt(job_description, candidate_resume)
+    params = {"response_format": {"type": "json_object"}, "max_tokens": SCREENING_MAX_TOKENS}
+    output = _invoke(system_prompt, prompt, use_cache=use_cache, agent="resume_screening_structured", timeout=timeout, **params)
+    try:
+        return parse_screening_result(output)
+    except ValueError:
+        if not use_cache:
+            raise
+    # A malformed reply may have come from the cache, ask again and overwrite it
+    output = _invoke(system_prompt, prompt, use_cache=False, agent="resume_screening_structured", timeout=timeout, **params)
+    return parse_screening_result(output)
+
+BATCH_SCREENING_INSTRUCTIONS = """Score how well each candidate fits the job, from 0 to 100.
+Weigh hard requirements most, deduct for missing ones and add for preferred qualifications.
+Judge every candidate on their own resume only.
+
+Reply with only a JSON object, no prose, with one entry per candidate ID:
+{"results": [{"id": "<candidate ID>", "score": <integer 0-100>, "strengths": [<up to 3 short phrases>], "weaknesses": [<up to 3 short phrases>], "recommendation": "<one short sentence>"}]}"""
+
+# Same Prefix as Single Screening, with Every Candidate of the Batch in the Final Message
+def _batch_screening_prompt(job_description, candidates):
+    job_description, resumes = compact_batch_inputs(job_description, [resume for _, resume in candidates], agent="resume_screening_batch")
+    system_prompt = f"{RESUME_SCREENING_SYSTEM.strip()}\n\n{BATCH_SCREENING_INSTRUCTIONS}"
+    blocks = [f"Candidate ID: {candidate_id}\n{resume}" for (candidate_id, _), resume in zip(candidates, resumes)]
+    return system_prompt, (f"Job Description:\n{job_description}", "Candidates:\n\n" + "\n\n".join(blocks))
+
+# Valid Entries of a Batch Reply by Candidate ID; Missing or Malformed Ones Are Left Out
+def parse_batch_screening_result(text, candidate_ids) -> Dict:
+    try:
+        data = json.loads(text)
+    except (TypeError, json.JSONDecodeError):
+        return {}
+    entries = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+
+    wanted = set(candidate_ids)
+    results = {}
+    for entry in entries:
+        candidate_id = str(entry.get("id")) if isinstance(entry, dict) else None
+        if candidate_id not in wanted or candidate_id in results:
+            continue
+        try:
+            results[candidate_id] = _screening_fields(entry, text)
+        except ValueError:
+            continue
+    return results
+
+# Several Candidates in One JSON-Mode Call; Returns Only the Entries That Validated
+@metrics.timed("agent.resume_screening_batch")
+def resume_screening_agent_batch(job_description, candidates, use_cache=True, timeout=None) -> Dict:
+    # candidates: list of (candidate_id, candidate_resume) pairs with unique string IDs
+    system_prompt, prompt = _batch_screening_prompt(job_description, candidates)
+    params = {"response_format": {"type": "json_object"}, "max_tokens": SCREENING_MAX_TOKENS * len(candidates)}
+    output = _invoke(system_prompt, prompt, use_cache=use_cache, agent="resume_screening_batch", timeout=timeout, **params)
+    return parse_batch_screening_result(output, [candidate_id for candidate_id, _ in candidates])
+
+def _interview_question_prompt(job_description, candidate_resume):
+    return _candidate_prompt(INTERVIEW_QUESTION_SYSTEM, INTERVIEW_QUESTION_INSTRUCTIONS, job_description, candidate_resume, "interview_question")
+
+@metrics.timed("agent.interview_question")
+def interview_question_agent(job_description, candidate_resume, use_cache=True):
+    system_prompt, prompt = _interview_question_prompt(job_description, candidate_resume)
+    return _invoke(system_prompt, prompt, use_cache=use_cache, agent="interview_question")
+
+def interview_question_agent_stream(job_description, candidate_resume, use_cache=True, max_seconds=None):
+    system_prompt, prompt = _interview_question_prompt(job_description, candidate_resume)
+    return _stream(system_prompt, prompt, use_cache=use_cache, max_seconds=max_seconds, agent="interview_question")
+
+SECTION_EXTRACTION_SYSTEM = "You are an expert resume section extractor."
+
+SECTION_EXTRACTION_INSTRUCTIONS = """Each input line is "<index>:<text>" for a line of the resume. Long lines are cut short, and blank lines and
+the continuation lines of long paragraphs are left out, so indices can skip.
+1. Find where the introduction (name, contact details, summary) ends and the main content begins.
+2. Find every section title in the main content, e.g. "EXPERIENCE", "EDUCATION", "SKILLS", "PROJECTS", "AWARDS".
+3. Classify each title as one of: experience, education, skills, others.
+
+Reply with only a JSON object of line indices, never repeating the resume text:
+{"body_start": <index of the first main-content line>, "headers": [{"line": <index>, "section": "<experience|education|skills|others>"}]}"""
+
+SECTION_EXTRACTION_MAX_TOKENS = 300
+
+# Line Indices for a Numbered-Line Resume; Replies Are Small Since No Text Is Echoed
+@metrics.timed("agent.resume_sections")
+def section_extraction_agent(numbered_lines, cache_id=None, use_cache=True) -> Dict:
+    system_prompt = f"{SECTION_EXTRACTION_SYSTEM}\n\n{SECTION_EXTRACTION_INSTRUCTIONS}"
+    params = {"response_format": {"type": "json_object"}, "max_tokens": SECTION_EXTRACTION_MAX_TOKENS}
+
+    def parse(output):
+        try:
+            data = json.loads(output)
+        except (TypeError, json.JSONDecodeError) as e:
+            raise MalformedReply(f"Section reply is not valid JSON: {output!r}") from e
+        if not isinstance(data, dict):
+            raise MalformedReply(f"Section reply is not a JSON object: {output!r}")
+        return data
+
+    output = _invoke(system_prompt, numbered_lines, use_cache=use_cache, agent="resume_sections", cache_id=cache_id, **params)
+    try:
+        return parse(output)
+    except ValueError:
+        if not use_cache:
+            raise
+    # A malformed reply may have come from the cache, ask again and overwrite it
+    output = _invoke(system_prompt, numbered_lines, use_cache=False, agent="resume_sections", cache_id=cache_id, **params)
+    return parse(output)
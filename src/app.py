@@ -1,8 +1,101 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import streamlit as st
 import pandas as pd
 
 from resume_parser import *
-from agents import job_description_agent, resume_screening_agent, interview_question_agent
+from agents import interview_question_agent, response_cache, STREAM_STOPPED_NOTE
+import agents
+from agents import job_description_agent_stream, resume_screening_agent_stream, interview_question_agent_stream
+from scoring import score_candidates, leaderboard, DEFAULT_WORKERS, DEFAULT_TIMEOUT, DEFAULT_RETRIES, DEFAULT_BATCH_SIZE
+from resume_store import ResumeStore, pdf_hash
+from ranking import prefilter_candidates, DEFAULT_TOP_K
+from candidates import build_candidate_table, DERIVED_COLUMNS
+from score_store import ScoreStore, text_fingerprint, content_diff
+from jobs import JobManager, JobCancelled, QUEUED, RUNNING, DONE, FAILED, CANCELLED, FINISHED
+import metrics
+
+# Parsed Resumes Persist Across Reruns, Refreshes and Requisitions
+resume_store = ResumeStore(PARSER_VERSION)
+
+# Scores Persist per (JD, Candidate) Fingerprint, So Only Stale Pairs Are Re-Scored
+score_store = ScoreStore()
+
+# Interview Questions Persist per (JD Fingerprint, Candidate Profile Fingerprint), So Reopening a Candidate Is Instant
+question_store = ScoreStore(table="questions")
+PREGENERATE_TOP_N = 5
+
+def score_mode(structured) -> str:
+    chat_client = agents.client_for("resume_screening_structured" if structured else "resume_screening")
+    model = getattr(chat_client, "model_name", type(chat_client).__name__)
+    return f"{'structured' if structured else 'analysis'}:{model}"
+
+def question_mode() -> str:
+    chat_client = agents.client_for("interview_question")
+    return f"questions:{getattr(chat_client, 'model_name', type(chat_client).__name__)}"
+
+def use_response_cache() -> bool:
+    return not st.session_state.get("bypass_cache", False)
+
+def response_cache_panel():
+    with st.sidebar.expander("Response cache"):
+        st.checkbox("Bypass cache", key="bypass_cache",
+                    help="Ignore cached replies and ask the LLM again; the fresh replies still replace the cached ones.")
+        stats = response_cache.stats()
+        st.metric("Hit rate", f"{stats['hit_rate']:.0%}", help=f"{stats['hits']} hits / {stats['misses']} misses")
+        st.metric("Latency saved", f"{stats['saved_seconds']:.1f} s")
+        st.caption(f"{stats['entries']} entries, {stats['bytes'] / 1024:.0f} KiB on disk")
+        if st.button("Clear cache"):
+            response_cache.clear()
+
+def generation_settings_panel():
+    with st.sidebar.expander("Generation"):
+        st.number_input("Max generation time (s)", min_value=10, max_value=600, value=120, step=10, key="max_generation_seconds")
+
+def max_generation_seconds() -> float:
+    return st.session_state.get("max_generation_seconds", 120)
+
+# Render Tokens as They Arrive and Report Time to First Token
+def render_stream(stream) -> str:
+    start = time.perf_counter()
+    timing = {}
+
+    def timed():
+        for chunk in stream:
+            timing.setdefault("first_token", time.perf_counter() - start)
+            yield chunk
+
+    result = st.write_stream(timed())
+    if "first_token" in timing:
+        st.caption(f"First token after {timing['first_token']:.2f}s, finished in {time.perf_counter() - start:.2f}s")
+    return result
+
+# The Flag Is Process-Wide, So It Only Changes When Someone Flips the Toggle, Never on a Plain Rerun
+def _toggle_metrics():
+    metrics.enable(st.session_state["collect_metrics"])
+
+# Per-Stage Timings, Collected Only While the Toggle Is On (HR_APP_METRICS Sets the Starting State)
+def performance_panel():
+    with st.sidebar.expander("Performance"):
+        st.toggle("Collect timings", value=metrics.is_enabled(), key="collect_metrics", on_change=_toggle_metrics,
+                  help="Applies to every session served by this process.")
+
+        snap = metrics.snapshot()
+        if snap["stages"]:
+            stages = pd.DataFrame.from_dict(snap["stages"], orient="index")
+            stages[["p50", "p95", "max"]] *= 1000
+            stages = stages.rename(columns={"p50": "p50 ms", "p95": "p95 ms", "max": "max ms", "total_seconds": "total s"})
+            st.dataframe(stages.round(2), use_container_width=True)
+        if snap["counters"]:
+            st.dataframe(pd.DataFrame(snap["counters"]), hide_index=True, use_container_width=True)
+        if not snap["stages"] and not snap["counters"]:
+            st.caption("No timings recorded yet.")
+
+        st.download_button("Export JSON", metrics.to_json(), file_name="hr_app_metrics.json", mime="application/json")
+        st.download_button("Export Prometheus", metrics.to_prometheus(), file_name="hr_app_metrics.prom", mime="text/plain")
+        if st.button("Reset timings"):
+            metrics.reset()
 
 def job_description_page():
     st.title("Job Description")
@@ -20,12 +113,20 @@ def job_description_page():
             height=400
         )
         generate_disabled = not bool(prompt.strip())
-        if st.button("Generate", key="generate_jd", disabled=generate_disabled):
-            result = job_description_agent(prompt)
-            st.session_state["final_job"] = result
+        generate = st.button("Generate", key="generate_jd", disabled=generate_disabled)
+        if generate:
+            # Any click reruns the script, which stops the stream below
+            st.button("Cancel generation", key="cancel_jd")
 
     with col2:
         st.subheader("Generated description")
+        if generate:
+            stream_box = st.empty()
+            with stream_box.container():
+                result = render_stream(job_description_agent_stream(prompt, use_cache=use_response_cache(), max_seconds=max_generation_seconds()))
+            st.session_state["final_job"] = result
+            stream_box.empty()
+
         edited = st.text_area(
             label="",
             value=st.session_state["final_job"],
@@ -34,6 +135,96 @@ def job_description_page():
         )
         st.session_state["final_job"]= edited
 
+# Background Jobs Shared by Every Session on This Server, Surviving Reruns
+@st.cache_resource
+def job_manager() -> JobManager:
+    return JobManager()
+
+POLL_SECONDS = 1.0
+
+# Render a Job's State, Polling Every POLL_SECONDS While It Runs
+def poll_job(session_key, render):
+    job = job_manager().get(st.session_state.get(session_key))
+    if job is None:
+        return
+    polling = job.is_active
+
+    def fragment():
+        current = job.snapshot()
+        render(job, current)
+        if current["status"] in (QUEUED, RUNNING):
+            if st.button("Cancel", key=f"cancel_{session_key}"):
+                job.cancel()
+        elif current["status"] == FAILED:
+            st.error(f"Job failed: {current['error']}")
+        elif current["status"] == CANCELLED:
+            st.warning("Job cancelled.")
+
+        # Finished while polling: rerun the whole page once so it stops polling and sees the result
+        if polling and current["status"] in FINISHED:
+            st.rerun()
+
+    st.fragment(fragment, run_every=POLL_SECONDS if polling else None)()
+
+def job_progress(current, noun):
+    if current["status"] in (QUEUED, RUNNING):
+        total = current["total"] or 0
+        fraction = current["done"] / total if total else 0.0
+        st.progress(min(1.0, fraction), text=f"{current['status'].title()}: {current['done']}/{total or '?'} {noun}")
+
+# Consume a Token Stream on a Worker Thread, Publishing the Text So Far
+def collect_stream(job, stream, key=None):
+    parts = []
+    try:
+        for chunk in stream:
+            job.check_cancelled()
+            parts.append(chunk)
+            job.set_partial({"key": key, "text": "".join(parts)})
+    finally:
+        stream.close()
+    return "".join(parts)
+
+# Jobs Started by Any Session, Openable from Here
+def jobs_panel():
+    jobs = job_manager().list()
+    with st.sidebar.expander(f"Jobs ({sum(job.is_active for job in jobs)} running)"):
+        if not jobs:
+            st.caption("No jobs yet.")
+            return
+        st.dataframe(
+            pd.DataFrame([{"id": j.id, "job": j.label, "status": j.status, "progress": f"{j.done}/{j.total or '?'}"} for j in jobs]),
+            hide_index=True, use_container_width=True,
+        )
+        selected = st.selectbox("Job", [j.id for j in jobs], format_func=lambda job_id: f"{job_id} · {job_manager().get(job_id).label}")
+        if st.button("Open in this session"):
+            job = job_manager().get(selected)
+            st.session_state[f"{job.kind}_job"] = job.id
+            st.session_state.pop(f"{job.kind}_job_applied", None)
+
+def run_parse_job(job, pdf_list, hashes, workers, llm_fallback, use_cache):
+    # Only Parse Files the Store Has Not Seen
+    known = resume_store.get_many(hashes)
+    pending = {sha: pdf_bytes for sha, pdf_bytes in zip(hashes, pdf_list) if sha not in known}
+    job.set_progress(0, len(pending))
+    stats = {"low_confidence": 0, "llm_sections": 0, "fallback_errors": 0}
+    provisional = []
+
+    # Parse New Uploads in Parallel, Reporting Progress as Each One Finishes
+    if pending:
+        fresh = parse_resumes_batch(list(pending.values()), workers=workers, progress_callback=job.set_progress,
+                                    hashes=list(pending.keys()), llm_fallback=llm_fallback, stats=stats, provisional=provisional,
+                                    use_cache=use_cache)
+        job.check_cancelled()
+        fresh = dict(zip(pending.keys(), fresh))
+        # Low-confidence splits the LLM did not redo are used this time but not stored, so a later run can still fall back
+        skipped = {sha for pos, sha in enumerate(pending) if pos in set(provisional)}
+        resume_store.put_many((sha, result) for sha, result in fresh.items() if sha not in skipped)
+        known.update(fresh)
+
+    # One Row per Candidate, with Scoring and Interview Text Formatted Up Front
+    parsed_resumes = [known[sha] for sha in hashes]
+    return {"table": build_candidate_table(parsed_resumes, hashes), "from_store": len(hashes) - len(pending), **stats}
+
 def resume_parsing_page():
     st.title("Resume Parsing")
     
@@ -44,42 +235,36 @@ def resume_parsing_page():
         accept_multiple_files=True,
         key="resume_uploads"    
     )
+    workers = st.number_input("Parsing workers", min_value=1, max_value=os.cpu_count() or 1, value=os.cpu_count() or 1, step=1)
+    llm_fallback = st.checkbox("LLM fallback for unrecognised layouts", value=True,
+                               help="Resumes whose section headers are not recognised confidently are split by the LLM instead.")
     
     if st.button("Parse & Extract Resumes"):
         if not uploads:
             st.warning("Upload at least one PDF.")
             return
         
-        resume_intros = []
-        resume_bodies = []
-        for uploaded_resume in uploads:
-            pdf_bytes = uploaded_resume.read()
-            parsed   = parse_pdf(pdf_bytes)
-            
-            resume_header, resume_body, resume_body_headers = extract_sections(parsed)
-                
-            # if isinstance(resume_header, list) and len(resume_header) == 0 or \
-            #     isinstance(resume_body, list) and len(resume_body) == 0 or \
-            #     isinstance(resume_body_headers, list) and len(resume_body_headers) == 0:
-            #     resume_header, resume_body, resume_body_headers = extract_sections_llm(client, clean_ascii(parsed))
-
-            intro = extract_personal_information(resume_header)
-            resume_intros.append(intro)
-
-            body = extract_resume_body(parsed, resume_body, resume_body_headers)
-            resume_bodies.append(body)
-        
-        # Merge Resume Intro & Body
-        intro_rows = [item for sub in resume_intros for item in sub]
-        body_rows  = [{ rec['criteria']: "\n".join(rec['requirement']) 
-                        for rec in resume } 
-                       for resume in resume_bodies]
-        intro_df = pd.DataFrame(intro_rows)
-        body_df  = pd.DataFrame(body_rows)
-        final_resume_df = pd.concat([intro_df, body_df], axis=1)
-        
-        # Store in Session State
-        st.session_state["final_resume"] = final_resume_df
+        pdf_list = [uploaded_resume.read() for uploaded_resume in uploads]
+        hashes = [pdf_hash(pdf_bytes) for pdf_bytes in pdf_list]
+        job = job_manager().submit("parse", run_parse_job, pdf_list, hashes, workers, llm_fallback, use_response_cache(), label=f"Parse {len(pdf_list)} resumes")
+        st.session_state["parse_job"] = job.id
+
+    def render(job, current):
+        job_progress(current, "new resumes parsed")
+        # A finished parse replaces the session's candidate table once
+        if current["status"] == DONE and st.session_state.get("parse_job_applied") != job.id:
+            st.session_state["final_resume"] = job.result["table"]
+            st.session_state["parse_job_applied"] = job.id
+        if current["status"] == DONE:
+            st.caption(f"{job.result['from_store']} of {len(job.result['table'])} resumes loaded from the parsed-resume store.")
+            if job.result["low_confidence"]:
+                st.caption(f"{job.result['low_confidence']} resumes had unrecognised sections, "
+                           f"{job.result['llm_sections']} of them were split by the LLM.")
+            if job.result["fallback_errors"]:
+                st.warning(f"The LLM section fallback failed for {job.result['fallback_errors']} resumes, which keep the rule-based "
+                           f"split and will be retried next time ({job.result['fallback_error']}).")
+
+    poll_job("parse_job", render)
     
     # Grab the Current Dataframe
     cur_df = st.session_state.get("final_resume", pd.DataFrame())
@@ -87,11 +272,64 @@ def resume_parsing_page():
         return  
 
     st.subheader("Extracted Resumes")
-    st.data_editor(cur_df, use_container_width=True, key="resume_editor")
+    st.data_editor(cur_df.drop(columns=DERIVED_COLUMNS, errors="ignore"), use_container_width=True, key="resume_editor")
+
+def run_score_job(job, job_description, candidates, names, reused, fingerprints, workers, timeout, retries, use_cache, structured, batch_size, max_seconds):
+    # Scores Still Valid for This JD Come First, Then Fresh Ones Are Stored as They Arrive
+    for item in reused:
+        job.add_result(item)
+    jd_fingerprint, mode = text_fingerprint(job_description), score_mode(structured)
+
+    def record(item):
+        job.add_result(item)
+        complete = item["error"] is None and (structured or STREAM_STOPPED_NOTE not in item["result"])
+        if complete:
+            score_store.put(jd_fingerprint, fingerprints[item["key"]], mode, item["result"])
+
+    # A Single Unstructured Worker Streams Each Analysis Token by Token
+    if not structured and workers == 1:
+        for key, resume in candidates:
+            job.check_cancelled()
+            start = time.perf_counter()
+            try:
+                text = collect_stream(job, resume_screening_agent_stream(job_description, resume, use_cache=use_cache, max_seconds=max_seconds), key)
+                error = None
+            except JobCancelled:
+                raise
+            except Exception as e:
+                text, error = None, e
+            record({"key": key, "name": names[key], "result": text, "error": error, "elapsed": time.perf_counter() - start})
+        return None
+
+    # Otherwise Results Arrive as Each Candidate Finishes
+    scored_stream = score_candidates(job_description, candidates, workers=workers, timeout=timeout, retries=retries,
+                                     use_cache=use_cache, structured=structured, batch_size=batch_size)
+    try:
+        for scored in scored_stream:
+            record({**scored, "name": names[scored["key"]]})
+            job.check_cancelled()
+    finally:
+        # Closing the generator cancels candidates still queued
+        scored_stream.close()
+    return leaderboard(job.results, names) if structured else None
     
 def candidate_scoring_page():
     st.title("Candidate Scoring")
 
+    # Engine Settings
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        workers = st.number_input("Concurrent requests", min_value=1, max_value=64, value=DEFAULT_WORKERS, step=1)
+    with col2:
+        timeout = st.number_input("Timeout per request (s)", min_value=5.0, max_value=600.0, value=DEFAULT_TIMEOUT, step=5.0)
+    with col3:
+        retries = st.number_input("Retries", min_value=0, max_value=10, value=DEFAULT_RETRIES, step=1)
+    structured = st.toggle("Structured scores", value=True, help="Compact JSON scores shown as a sortable leaderboard")
+    batch_size = st.number_input("Candidates per request", min_value=1, max_value=32, value=DEFAULT_BATCH_SIZE, step=1, disabled=not structured,
+                                 help="Short resumes can share one structured scoring call, entries missing from the reply are scored on their own")
+    top_k = st.number_input("Candidates sent to the LLM (top-K, 0 = all)", min_value=0, max_value=10000, value=DEFAULT_TOP_K, step=5,
+                            help="A local TF-IDF and keyword prefilter ranks the pool first, only the top-K are scored by the LLM")
+
     # Score Button
     if st.button("Score Candidates"):
         job = st.session_state.get("final_job", [])
@@ -108,47 +346,119 @@ def candidate_scoring_page():
             st.warning("Parse at least one resume first.")
             return
         
-        for idx, row in res.iterrows():
-            res_compiled = row["Education"] + "\n" + row["Experience"] + "\n" + row["Skills"] + "\n" + row["Others"]
-            json_output = resume_screening_agent(job, res_compiled)
-                        
-            st.subheader("Candidate Analysis")
-            st.write(json_output)
-            st.write("==============================")
-
-def clean_text(text: str) -> str:
-    if not isinstance(text, str):
-        return ""
-    text = text.replace('\\n', '\n')  
-    text = text.replace('\t', ' ')
-    text = re.sub(r' +', ' ', text)
-    text = re.sub(r'\n\s+', '\n', text)
-    text = text.strip()
-    return text
-
-def format_resume_row(row: pd.Series) -> str:
-    sections = []
-
-    # Top header info
-    header_fields = ["name", "email", "mobile", "websites", "location", "others"]
-    for field in header_fields:
-        if field in row and row[field] is not None and not (isinstance(row[field], float) and pd.isna(row[field])):
-            value = row[field]
-            if isinstance(value, (list, tuple)):
-                value = ", ".join(map(str, value))
-            cleaned = clean_text(str(value))
-            if cleaned.strip():
-                sections.append(f"**{field.title()}:** {cleaned}")
-
-    # Resume content sections
-    content_sections = ["Education", "Experience", "Skills", "Others"]
-    for section in content_sections:
-        if section in row and pd.notna(row[section]):
-            cleaned = clean_text(str(row[section]))
-            if cleaned.strip():
-                sections.append(f"\n### {section.title()}\n{cleaned}")
-
-    return "\n\n".join(sections)
+        # Stage 1: Cheap Local Ranking Decides Who Reaches the LLM
+        ranked = prefilter_candidates(job, res, top_k=top_k)
+        st.session_state["prefilter_table"] = ranked
+        shortlist = ranked.index[ranked["selected"]]
+        st.caption(f"Scoring {len(shortlist)} of {len(res)} candidates with the LLM, {len(res) - len(shortlist)} calls skipped by the prefilter.")
+
+        # Stage 2: Reuse Scores Whose JD and Resume Fingerprints Are Unchanged
+        candidates = list(zip(shortlist, res.loc[shortlist, "resume_text"]))
+        names = {idx: (res.at[idx, "name"] or idx) if "name" in res.columns else idx for idx, _ in candidates}
+        fingerprints = dict(zip(shortlist, res.loc[shortlist, "fingerprint"]))
+        known = score_store.get_many(text_fingerprint(job), fingerprints.values(), score_mode(structured))
+        reused = [
+            {"key": idx, "name": names[idx], "result": known[fingerprints[idx]], "error": None, "elapsed": 0.0, "reused": True}
+            for idx, _ in candidates if fingerprints[idx] in known
+        ]
+        stale = [(idx, text) for idx, text in candidates if fingerprints[idx] not in known]
+        notes = [f"{len(reused)} of {len(candidates)} scores still valid for this job description, {len(reused)} LLM calls skipped."]
+
+        # What Changed in the JD Since the Last Run, and Whether It Mattered
+        previous = st.session_state.get("scored_job")
+        if isinstance(previous, str) and previous != job:
+            added, removed = content_diff(previous, job)
+            if not added and not removed:
+                notes.append("Job description edits since the last run are cosmetic, existing scores were kept.")
+            else:
+                notes.append("Job description changed: " + " ".join(["+" + w for w in added[:10]] + ["-" + w for w in removed[:10]]))
+        st.session_state["scored_job"] = job
+
+        # Stage 3: LLM Scoring of the Stale Pairs, in the Background
+        scoring_job = job_manager().submit(
+            "score", run_score_job, job, stale, names, reused, fingerprints, workers, timeout, retries, use_response_cache(), structured,
+            batch_size, max_generation_seconds(), label=f"Score {len(stale)} of {len(candidates)} candidates", total=len(candidates),
+            meta={"structured": structured, "names": names, "notes": notes},
+        )
+        st.session_state["score_job"] = scoring_job.id
+
+    def render(job, current):
+        for note in job.meta.get("notes", []):
+            st.caption(note)
+        job_progress(current, "candidates scored")
+        results = current["results"]
+        for scored in results:
+            if scored["error"] is not None:
+                st.error(f"Scoring failed for {scored['name']}: {scored['error']}")
+
+        # Structured Scores Fill the Leaderboard as Each Candidate Finishes
+        if job.meta.get("structured"):
+            names = {scored["key"]: scored["name"] for scored in results}
+            st.subheader("Leaderboard")
+            st.dataframe(leaderboard(results, names), use_container_width=True)
+            return
+
+        # Analyses Appear One by One, with the One in Progress Shown as Far as It Has Got
+        for scored in results:
+            if scored["error"] is None:
+                st.subheader(f"Candidate Analysis: {scored['name']}")
+                st.write(scored["result"])
+                st.write("==============================")
+        partial = current["partial"]
+        if partial and current["status"] == RUNNING:
+            st.subheader(f"Candidate Analysis: {job.meta['names'].get(partial['key'], partial['key'])}")
+            st.write(partial["text"])
+
+    # First-Stage Scores of the Latest Run
+    prefilter_table = st.session_state.get("prefilter_table")
+    if isinstance(prefilter_table, pd.DataFrame) and not prefilter_table.empty:
+        with st.expander("Prefilter ranking", expanded=False):
+            st.dataframe(prefilter_table, use_container_width=True)
+
+    poll_job("score_job", render)
+
+def run_question_job(job, job_description, candidate_resume, use_cache, max_seconds, pair):
+    questions = collect_stream(job, interview_question_agent_stream(job_description, candidate_resume, use_cache=use_cache, max_seconds=max_seconds))
+    # Only complete question sets are memoised
+    if STREAM_STOPPED_NOTE not in questions:
+        question_store.put(*pair, question_mode(), questions)
+    return questions
+
+# Top-Ranked Candidates for a JD: Stored Structured Scores First, Then the Local Prefilter Order
+def top_candidates(job_description, table, n):
+    ranked = prefilter_candidates(job_description, table, top_k=0)
+    fingerprints = table.loc[ranked.index, "fingerprint"]
+    known = score_store.get_many(text_fingerprint(job_description), fingerprints, score_mode(True))
+    llm_scores = fingerprints.map(lambda fp: known[fp]["score"] if fp in known else -1)
+    return list(llm_scores.sort_values(ascending=False, kind="stable").index[:n])
+
+# Question Sets for Several Candidates at Once, Stored as Each One Finishes
+def run_pregenerate_job(job, job_description, candidates, names, workers, use_cache):
+    jd_fingerprint, mode = text_fingerprint(job_description), question_mode()
+
+    def generate(profile_fingerprint, resume):
+        job.check_cancelled()
+        questions = interview_question_agent(job_description, resume, use_cache=use_cache)
+        question_store.put(jd_fingerprint, profile_fingerprint, mode, questions)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(generate, fp, resume): key for key, fp, resume in candidates}
+        try:
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                    error = None
+                except JobCancelled:
+                    raise
+                except Exception as e:
+                    error = e
+                job.add_result({"key": key, "name": names[key], "error": error})
+        finally:
+            # Candidates not started yet are dropped on cancel or failure
+            for future in futures:
+                future.cancel()
+    return sum(item["error"] is None for item in job.results)
 
 def interview_question_page():
     st.title("Interview Questions")
@@ -169,21 +479,15 @@ def interview_question_page():
 
     with col2:
         st.subheader("Candidate Resume")
-        final_resume = st.session_state["final_resume"]
+        final_resume = st.session_state.get("final_resume")
+        has_candidates = isinstance(final_resume, pd.DataFrame) and not final_resume.empty and "profile_text" in final_resume.columns
 
-        if isinstance(final_resume, pd.DataFrame) and not final_resume.empty and "name" in final_resume.columns:
-            candidate_names = final_resume["name"].tolist()
-            selected_name = st.selectbox("Select a candidate", candidate_names)
+        if has_candidates:
+            names = final_resume["name"]
+            selected_id = st.selectbox("Select a candidate", final_resume.index, format_func=lambda cid: names.at[cid] or cid)
 
-            # Select entire row (as a Series) for the selected candidate
-            selected_row = final_resume[final_resume["name"] == selected_name]
-
-            if not selected_row.empty:
-                with pd.option_context('display.max_colwidth', None):
-                    resume_row = selected_row.iloc[0]
-                    row_text = format_resume_row(resume_row)
-            else:
-                row_text = ""
+            # Profile text was formatted when the table was built, so this is a single lookup
+            row_text = final_resume.at[selected_id, "profile_text"]
         else:
             st.selectbox("Select a candidate", options=["No candidates available"], index=0, disabled=True)
             row_text = ""
@@ -194,13 +498,71 @@ def interview_question_page():
             placeholder="Paste candidate resume...",
             value=row_text,
         )
-        
-    if st.button("Generate Questions"):
+
+    # Memoised Questions for This JD and Candidate; an Edited Resume Gets Its Own Fingerprint
+    jd_fingerprint, profile_fingerprint = text_fingerprint(job_description), text_fingerprint(candidate_resume)
+    pair = (jd_fingerprint, profile_fingerprint)
+    memoised = question_store.get_many(jd_fingerprint, [profile_fingerprint], question_mode()).get(profile_fingerprint)
+
+    if st.button("Regenerate Questions" if memoised else "Generate Questions"):
         if not job_description or not candidate_resume:
             st.error("Please fill in both the job description and candidate resume.")
         else:
-            output = interview_question_agent(final_resume, candidate_resume)
-            st.markdown(output)
+            # Regenerating asks the model again instead of replaying the cached reply
+            question_job = job_manager().submit(
+                "question", run_question_job, job_description, candidate_resume, use_response_cache() and not memoised,
+                max_generation_seconds(), pair, label="Interview questions", meta={"pair": pair},
+            )
+            st.session_state["question_job"] = question_job.id
+
+    def render(job, current):
+        if current["status"] == DONE:
+            st.write(job.result)
+            st.caption(f"Finished in {current['elapsed']:.2f}s")
+        elif current["partial"]:
+            st.write(current["partial"]["text"])
+        elif current["status"] in (QUEUED, RUNNING):
+            st.caption(f"{current['status'].title()}…")
+
+    # A Question Job for Another Candidate or JD Does Not Hide This One's Stored Questions
+    question_job = job_manager().get(st.session_state.get("question_job"))
+    if question_job is not None and question_job.meta.get("pair") == pair:
+        poll_job("question_job", render)
+    elif memoised:
+        st.write(memoised)
+        st.caption("Generated earlier for this job description and candidate.")
+
+    if not has_candidates:
+        return
+
+    # Pre-Generate for the Top-Ranked Candidates in the Background
+    with st.expander("Pre-generate for top candidates"):
+        top_n = st.number_input("Candidates", min_value=1, max_value=len(final_resume), value=min(PREGENERATE_TOP_N, len(final_resume)), step=1)
+        if st.button("Pre-generate questions", disabled=not job_description):
+            top_ids = top_candidates(job_description, final_resume, top_n)
+            profiles = final_resume.loc[top_ids, "profile_text"]
+            fingerprints = {cid: text_fingerprint(text) for cid, text in profiles.items()}
+            known = question_store.get_many(jd_fingerprint, fingerprints.values(), question_mode())
+            pending = [(cid, fingerprints[cid], profiles[cid]) for cid in top_ids if fingerprints[cid] not in known]
+            top_names = {cid: names.at[cid] or cid for cid in top_ids}
+            job = job_manager().submit(
+                "pregenerate", run_pregenerate_job, job_description, pending, top_names, DEFAULT_WORKERS, use_response_cache(),
+                label=f"Questions for {len(pending)} of top {len(top_ids)}", total=len(pending),
+                meta={"notes": [f"{len(top_ids) - len(pending)} of the top {len(top_ids)} already have questions for this job description."]},
+            )
+            st.session_state["pregenerate_job"] = job.id
+
+        def render_pregenerate(job, current):
+            for note in job.meta.get("notes", []):
+                st.caption(note)
+            job_progress(current, "question sets ready")
+            for item in current["results"]:
+                if item["error"] is not None:
+                    st.error(f"Questions failed for {item['name']}: {item['error']}")
+            if current["status"] == DONE:
+                st.caption(f"{job.result} question sets ready in {current['elapsed']:.1f}s.")
+
+        poll_job("pregenerate_job", render_pregenerate)
     
 # Page Navifation
 PAGES = {
@@ -212,4 +574,8 @@ PAGES = {
 
 st.sidebar.title("Navigation")
 choice = st.sidebar.radio("Go to", list(PAGES.keys()))
+generation_settings_panel()
 PAGES[choice]()
+jobs_panel()
+response_cache_panel()
+performance_panel()
@@ -0,0 +1,141 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+# Cache Location and Global Bypass Flag
+CACHE_DIR = os.environ.get("HR_APP_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "hr-app"))
+CACHE_BYPASS = os.environ.get("HR_APP_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+
+DEFAULT_TTL = 7 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Content-Addressed Key for an LLM Call
+def cache_key(model, temperature, system_prompt, prompt, **params):
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "system": system_prompt,
+            "prompt": prompt,
+            "params": params,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# Persistent LLM Response Cache with TTL and Size-Bounded LRU Eviction
+class ResponseCache:
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES, enabled=not CACHE_BYPASS):
+        self.path = path or os.path.join(CACHE_DIR, "responses.sqlite3")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    latency REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, latency, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl is not None and now - row[2] > self.ttl:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+            self.saved_seconds += row[1]
+            return row[0]
+
+    def set(self, key, value, latency=0.0):
+        if not self.enabled:
+            return
+
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, latency, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, size, latency, now, now),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn):
+        # Drop least recently used entries once the total size exceeds the bound
+        conn.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY last_access DESC, key) AS running
+                    FROM responses
+                ) WHERE running > ?
+            )
+            """,
+            (self.max_bytes,),
+        )
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            self.hits = self.misses = 0
+            self.saved_seconds = 0.0
+
+    def stats(self):
+        with self._lock:
+            conn = self._connect()
+            entries, total_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "saved_seconds": self.saved_seconds,
+                "entries": entries,
+                "bytes": total_bytes,
+            }
@@ -0,0 +1,52 @@
+import hashlib
+
+import pandas as pd
+
+from prompts import RESUME_SECTIONS, clean_series, join_nonempty, resume_text_column
+
+# Candidate Table Layout
+INTRO_FIELDS = ["name", "email", "mobile", "websites", "location", "others"]
+DERIVED_COLUMNS = ["resume_text", "profile_text", "fingerprint"]
+ID_LENGTH = 12
+
+# Stable ID: Same PDF, Same Candidate, Across Reruns and Sessions
+def candidate_id(sha256):
+    return sha256[:ID_LENGTH]
+
+# Candidate Profile Shown on the Interview Page, Formatted Once per Table
+def profile_text_column(table, sections):
+    parts = []
+    for field in INTRO_FIELDS:
+        values = table[field]
+        is_list = values.map(lambda value: isinstance(value, (list, tuple)))
+        values = values.where(~is_list, values[is_list].map(lambda value: ", ".join(map(str, value))))
+        text = clean_series(values)
+        parts.append(text.where(text.eq(""), f"**{field.title()}:** " + text))
+    for section, text in sections.items():
+        parts.append(text.where(text.eq(""), f"\n### {section.title()}\n" + text))
+    return join_nonempty(parts, "\n\n")
+
+# Column-Oriented Candidate Table from Parsed (Intro, Body) Pairs, Indexed by Candidate ID
+def build_candidate_table(parsed_resumes, hashes):
+    columns = {field: [] for field in INTRO_FIELDS + RESUME_SECTIONS}
+    for intro, body in parsed_resumes:
+        info = intro[0] if intro else {}
+        for field in INTRO_FIELDS:
+            columns[field].append(info.get(field))
+        sections = {rec["criteria"]: rec["requirement"] for rec in body}
+        for section in RESUME_SECTIONS:
+            columns[section].append("\n".join(sections.get(section, [])))
+
+    index = pd.Index([candidate_id(sha) for sha in hashes], name="candidate_id")
+    table = pd.DataFrame(columns, index=index)
+    # The same PDF uploaded twice is one candidate
+    table = table[~table.index.duplicated()]
+
+    # Sections are cleaned once and shared by both text columns
+    sections = {section: clean_series(table[section]) for section in RESUME_SECTIONS}
+    table["resume_text"] = resume_text_column(sections)
+    table["profile_text"] = profile_text_column(table, sections)
+    # Scores are reused while this stays the same, see ScoreStore
+    # resume_text is already cleaned, so it is hashed as is rather than re-tokenised like free text
+    table["fingerprint"] = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in table["resume_text"]]
+    return table
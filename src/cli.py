@@ -0,0 +1,245 @@
+import os
+import csv
+import sys
+import json
+import glob
+import time
+import argparse
+
+import pandas as pd
+
+from contextlib import nullcontext
+
+from resume_parser import parse_resumes_batch, parse_pool, PARSER_VERSION
+from resume_store import ResumeStore, pdf_hash
+from prompts import resume_payloads
+
+# Output Columns, in File Order
+INTRO_FIELDS = ["name", "email", "mobile", "websites", "location", "others"]
+BODY_FIELDS = ["Education", "Experience", "Skills", "Others"]
+SCORE_FIELDS = ["score", "strengths", "weaknesses", "recommendation", "error"]
+FIELDS = ["file", "sha256", *INTRO_FIELDS, *BODY_FIELDS, *SCORE_FIELDS]
+
+# What Ends a Complete Record in the Line-Based Formats; csv.writer Ends Rows with \r\n, Fields Only Hold Bare \n
+TERMINATORS = {"jsonl": b"\n", "csv": b"\r\n"}
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    return {".csv": "csv", ".parquet": "parquet", ".jsonl": "jsonl", ".json": "jsonl"}.get(ext, "jsonl")
+
+# Files Already Written to the Output, So an Interrupted Run Can Resume
+def completed_files(path, fmt):
+    if not os.path.exists(path):
+        return set()
+
+    # A torn last record from an interrupted run is not done: write_records cuts it and the file is processed again
+    if fmt == "jsonl":
+        done = set()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    done.add(json.loads(line)["file"])
+                except (json.JSONDecodeError, KeyError):
+                    continue
+        return done
+    if fmt == "csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        if rows and not has_complete_tail(path, fmt):
+            rows.pop()
+        return {row["file"] for row in rows if row.get("file")}
+    if fmt == "parquet":
+        parts = sorted(glob.glob(os.path.join(path, "part-*.parquet")))
+        return {file for part in parts for file in pd.read_parquet(part, columns=["file"])["file"]}
+    raise ValueError(f"Unknown output format: {fmt}")
+
+def has_complete_tail(path, fmt):
+    terminator = TERMINATORS[fmt]
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return True
+        f.seek(max(0, size - len(terminator)))
+        return f.read() == terminator
+
+# Cut the File Back to Its Last Complete Record, So an Append Never Lands on a Torn Line
+def drop_torn_tail(path, fmt, block=1 << 16):
+    if not os.path.exists(path) or has_complete_tail(path, fmt):
+        return
+    terminator = TERMINATORS[fmt]
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - block)
+            f.seek(start)
+            found = f.read(end - start).rfind(terminator)
+            if found != -1:
+                f.truncate(start + found + len(terminator))
+                return
+            # Overlap blocks so a terminator split across them is still found
+            end = start + len(terminator) - 1 if start else 0
+        f.truncate(0)
+
+# Append a Batch of Records to the Output
+def write_records(path, fmt, records):
+    if not records:
+        return
+
+    if fmt in TERMINATORS:
+        drop_torn_tail(path, fmt)
+    if fmt == "jsonl":
+        with open(path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    elif fmt == "csv":
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            if new_file:
+                writer.writeheader()
+            for record in records:
+                writer.writerow({k: "; ".join(v) if isinstance(v, list) else v for k, v in record.items()})
+            f.flush()
+            os.fsync(f.fileno())
+    elif fmt == "parquet":
+        # Parquet files cannot be appended to, so each batch becomes its own part file
+        os.makedirs(path, exist_ok=True)
+        n_parts = len(glob.glob(os.path.join(path, "part-*.parquet")))
+        frame = pd.DataFrame(records, columns=FIELDS)
+        tmp = os.path.join(path, f".part-{n_parts:05d}.parquet.tmp")
+        frame.to_parquet(tmp, index=False)
+        os.replace(tmp, os.path.join(path, f"part-{n_parts:05d}.parquet"))
+    else:
+        raise ValueError(f"Unknown output format: {fmt}")
+
+# Flatten One Parsed Resume into an Output Record
+def to_record(file, sha256, intro, body):
+    record = {field: None for field in FIELDS}
+    record.update(file=file, sha256=sha256)
+    for field in INTRO_FIELDS:
+        record[field] = intro[0].get(field)
+    for rec in body:
+        record[rec["criteria"]] = "\n".join(rec["requirement"])
+    return record
+
+# Parse, Optionally Score, and Write One Batch of Files
+def process_batch(batch, args, store, stats, executor=None):
+    pdf_bytes = {}
+    for path in batch:
+        with open(path, "rb") as f:
+            pdf_bytes[path] = f.read()
+    hashes = {path: pdf_hash(data) for path, data in pdf_bytes.items()}
+
+    # Parsed results from earlier runs or the app are reused
+    known = store.get_many(hashes.values())
+    pending = [path for path in batch if hashes[path] not in known]
+    provisional = []
+    if pending:
+        start = time.perf_counter()
+        # Chunks small enough that every worker in the shared pool gets a share of the batch
+        chunk_size = max(1, min(8, -(-len(pending) // args.workers)))
+        parsed = parse_resumes_batch([pdf_bytes[path] for path in pending], workers=args.workers, chunk_size=chunk_size,
+                                     hashes=[hashes[path] for path in pending], llm_fallback=args.llm_fallback, stats=stats,
+                                     executor=executor, provisional=provisional)
+        stats["parse_seconds"] += time.perf_counter() - start
+        fresh = {hashes[path]: result for path, result in zip(pending, parsed)}
+        # Low-confidence splits the LLM did not redo are written out but not stored, so a later --llm-fallback run can redo them
+        skipped = {hashes[pending[pos]] for pos in provisional}
+        store.put_many((sha, result) for sha, result in fresh.items() if sha not in skipped)
+        known.update(fresh)
+    stats["parsed"] += len(pending)
+    stats["from_store"] += len(batch) - len(pending)
+
+    records = {}
+    for path in batch:
+        intro, body = known[hashes[path]]
+        rel = os.path.relpath(path, args.resumes)
+        records[rel] = to_record(rel, hashes[path], intro, body)
+
+    if args.score:
+        from scoring import score_candidates
+
+        start = time.perf_counter()
+        # The same resume text the app builds in its candidate table, so both send identical prompts
+        candidates = list(zip(records, resume_payloads(records.values())))
+        for scored in score_candidates(args.job_description, candidates, workers=args.concurrency,
+                                       timeout=args.timeout, retries=args.retries, structured=True,
+                                       batch_size=args.score_batch_size):
+            record = records[scored["key"]]
+            if scored["error"] is not None:
+                record["error"] = str(scored["error"])
+                stats["score_errors"] += 1
+            else:
+                record.update(scored["result"])
+            stats["scored"] += 1
+        stats["score_seconds"] += time.perf_counter() - start
+
+    write_records(args.out, args.format, list(records.values()))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-parse a directory of resumes and optionally score them against a job description.")
+    parser.add_argument("--resumes", required=True, help="Directory of PDF resumes (searched recursively)")
+    parser.add_argument("--jd", help="Text file holding the job description (required with --score)")
+    parser.add_argument("--out", required=True, help="Output .jsonl, .csv or .parquet (a directory of part files)")
+    parser.add_argument("--format", choices=["jsonl", "csv", "parquet"], help="Output format, inferred from --out by default")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parsing processes")
+    parser.add_argument("--batch-size", type=int, default=32, help="Files parsed and written per batch")
+    parser.add_argument("--llm-fallback", action="store_true", help="Let the LLM split resumes whose sections are not recognised confidently")
+    parser.add_argument("--score", action="store_true", help="Score each resume with the LLM")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent LLM scoring requests")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Timeout per scoring request in seconds")
+    parser.add_argument("--retries", type=int, default=2, help="Retries per scoring request")
+    parser.add_argument("--score-batch-size", type=int, default=1, help="Candidates per scoring request, within a token budget")
+    args = parser.parse_args(argv)
+
+    if args.score and not args.jd:
+        parser.error("--score needs --jd")
+    args.format = args.format or detect_format(args.out)
+    args.job_description = None
+    if args.jd:
+        with open(args.jd, encoding="utf-8") as f:
+            args.job_description = f.read()
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    files = sorted(glob.glob(os.path.join(args.resumes, "**", "*.pdf"), recursive=True))
+    done = completed_files(args.out, args.format)
+    todo = [path for path in files if os.path.relpath(path, args.resumes) not in done]
+    print(f"{len(files)} PDFs found, {len(files) - len(todo)} already in {args.out}, {len(todo)} to process", file=sys.stderr)
+
+    store = ResumeStore(PARSER_VERSION)
+    stats = {"parsed": 0, "from_store": 0, "scored": 0, "score_errors": 0, "parse_seconds": 0.0, "score_seconds": 0.0,
+             "low_confidence": 0, "llm_sections": 0, "fallback_errors": 0}
+    start = time.perf_counter()
+    # One pool of parse workers for the whole run; spawning and loading spaCy per batch would dominate small batches
+    with parse_pool(args.workers) if args.workers > 1 and todo else nullcontext() as executor:
+        for i in range(0, len(todo), args.batch_size):
+            process_batch(todo[i : i + args.batch_size], args, store, stats, executor)
+            print(f"{min(i + args.batch_size, len(todo))}/{len(todo)} files written", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    # Throughput Summary
+    processed = stats["parsed"] + stats["from_store"]
+    print(f"processed {processed} files in {elapsed:.1f}s ({processed / elapsed if elapsed else 0:.1f} files/s)", file=sys.stderr)
+    if stats["parsed"]:
+        print(f"parsed {stats['parsed']} new files in {stats['parse_seconds']:.1f}s "
+              f"({stats['parsed'] / stats['parse_seconds']:.1f} files/s), {stats['from_store']} from the store", file=sys.stderr)
+    if stats["low_confidence"]:
+        print(f"low-confidence sections: {stats['low_confidence']} of {stats['parsed']} parsed files "
+              f"({stats['low_confidence'] / stats['parsed']:.0%}), {stats['llm_sections']} split by the LLM", file=sys.stderr)
+        if not args.llm_fallback:
+            print("rule-based splits of those files were not stored; rerun with --llm-fallback to have the LLM split them", file=sys.stderr)
+    if stats["fallback_errors"]:
+        print(f"LLM section fallback failed for {stats['fallback_errors']} files, not stored ({stats['fallback_error']})", file=sys.stderr)
+    if stats["scored"]:
+        print(f"scored {stats['scored']} files in {stats['score_seconds']:.1f}s "
+              f"({stats['scored'] / stats['score_seconds']:.1f} calls/s), {stats['score_errors']} failed", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
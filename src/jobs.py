@@ -0,0 +1,145 @@
+import time
+import uuid
+import threading
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Job Lifecycle
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+DEFAULT_JOB_WORKERS = 4
+MAX_FINISHED_JOBS = 50
+
+class JobCancelled(Exception):
+    pass
+
+# One Unit of Background Work: Status, Progress and Partial Results, Safe to Read from Any Thread
+class Job:
+    def __init__(self, kind, label="", meta=None):
+        self.id = uuid.uuid4().hex[:10]
+        self.kind = kind
+        self.label = label
+        self.meta = meta or {}
+        self.status = QUEUED
+        self.done = 0
+        self.total = None
+        self.results = []
+        self.partial = None
+        self.result = None
+        self.error = None
+        self.traceback = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    # Called from the job function
+    def set_progress(self, done, total=None):
+        with self._lock:
+            self.done = done
+            if total is not None:
+                self.total = total
+
+    def add_result(self, item):
+        with self._lock:
+            self.results.append(item)
+            self.done = len(self.results)
+            self.partial = None
+
+    def set_partial(self, value):
+        with self._lock:
+            self.partial = value
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    # Called from the pages
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def is_active(self):
+        return self.status not in FINISHED
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "id": self.id,
+                "kind": self.kind,
+                "label": self.label,
+                "status": self.status,
+                "done": self.done,
+                "total": self.total,
+                "results": list(self.results),
+                "partial": self.partial,
+                "error": self.error,
+                "elapsed": (self.finished or time.time()) - (self.started or self.created),
+            }
+
+# Worker Threads and a Registry of Recent Jobs, One per Server Process
+class JobManager:
+    def __init__(self, workers=DEFAULT_JOB_WORKERS, max_finished=MAX_FINISHED_JOBS):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self.max_finished = max_finished
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    # fn(job, *args, **kwargs) runs on a worker thread; its return value becomes job.result
+    def submit(self, kind, fn, *args, label="", meta=None, total=None, **kwargs):
+        job = Job(kind, label=label, meta=meta)
+        job.total = total
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self.executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job, fn, args, kwargs):
+        if job.cancelled:
+            job.status, job.finished = CANCELLED, time.time()
+            return
+        job.status, job.started = RUNNING, time.time()
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.status = CANCELLED if job.cancelled else DONE
+        except JobCancelled:
+            job.status = CANCELLED
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.traceback = traceback.format_exc()
+            job.status = FAILED
+        finally:
+            job.finished = time.time()
+
+    # Drop the oldest finished jobs beyond the limit; running ones are always kept
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if not job.is_active]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, kind=None):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job for job in reversed(jobs) if kind is None or job.kind == kind]
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job
@@ -0,0 +1,192 @@
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import threading
+from types import SimpleNamespace
+
+# Backend and Per-Task Models, Overridable per Deployment
+LLM_BACKEND = os.environ.get("HR_APP_LLM_BACKEND", "groq").lower()
+LARGE_MODEL = "llama-3.3-70b-versatile"
+SMALL_MODEL = "llama-3.1-8b-instant"
+TEMPERATURE = 0.7
+
+# Short, High-Volume Calls Go to the Small Model; Long-Form Writing Stays on the 70B One
+TASK_MODELS = {
+    "job_description": os.environ.get("HR_APP_JD_MODEL", LARGE_MODEL),
+    "screening": os.environ.get("HR_APP_SCREENING_MODEL", SMALL_MODEL),
+    "interview": os.environ.get("HR_APP_INTERVIEW_MODEL", LARGE_MODEL),
+    "sections": os.environ.get("HR_APP_SECTIONS_MODEL", SMALL_MODEL),
+}
+
+# One Keep-Alive Connection Pool for Every Model's Client
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HR_APP_HTTP_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_SECONDS = 30.0
+HTTP_TIMEOUT = 60.0
+
+_http_client = None
+_http_lock = threading.Lock()
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def model_for(task):
+    return TASK_MODELS.get(task, LARGE_MODEL)
+
+def http_client():
+    global _http_client
+    with _http_lock:
+        if _http_client is None:
+            import httpx
+
+            _http_client = httpx.Client(
+                timeout=HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_SECONDS,
+                ),
+            )
+        return _http_client
+
+# Retries are left to the shared rate limiter so backoff is coordinated across calls
+def _groq_client(model):
+    from langchain_groq import ChatGroq
+
+    return ChatGroq(model_name=model, temperature=TEMPERATURE, max_retries=0, http_client=http_client())
+
+def _stub_client(model):
+    return StubLLM(latency=float(os.environ.get("HR_APP_STUB_LATENCY", "0")), jitter=0.0, model_name=model)
+
+# Backend Name -> Factory Taking a Model Name; register_backend Adds More
+BACKENDS = {"groq": _groq_client, "stub": _stub_client}
+
+def register_backend(name, factory):
+    BACKENDS[name] = factory
+
+# Clients Are Built on First Use, Once per (Backend, Model), and Shared Across Threads
+def get_client(task, backend=None):
+    backend = (backend or LLM_BACKEND).lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend {backend!r}; expected one of {sorted(BACKENDS)}")
+    key = (backend, model_for(task))
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = BACKENDS[backend](key[1])
+        return _clients[key]
+
+def reset_clients():
+    global _http_client
+    with _clients_lock:
+        _clients.clear()
+    with _http_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+CANDIDATE_ID_RE = re.compile(r"^Candidate ID: (.+)$", re.MULTILINE)
+NUMBERED_LINE_RE = re.compile(r"^(\d+):(.*)$")
+STUB_SECTIONS = ("experience", "education", "skills")
+
+# Deterministic Local Stand-in for a Chat Client: Same Prompt, Same Reply, No Network
+class StubLLM:
+    def __init__(self, latency=0.2, jitter=0.05, seed=0, first_token=None, chunks=20, prefix_cache=False, cached_speedup=0.5,
+                 token_latency=0.0, drop_rate=0.0, model_name="stub"):
+        self.model_name = model_name
+        self.temperature = 0.0
+        self.latency = latency
+        # Extra seconds per 1000 prompt tokens, and the share of batch entries left out of the reply
+        self.token_latency = token_latency
+        self.drop_rate = drop_rate
+        self.jitter = jitter
+        self.first_token = latency * 0.1 if first_token is None else first_token
+        self.chunks = chunks
+        self.calls = 0
+        self._random = random.Random(seed)
+
+        # Provider-style prompt caching: every message but the last is the prefix
+        self.prefix_cache = prefix_cache
+        self.cached_speedup = cached_speedup
+        self.prefixes = []
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def _duration(self):
+        with self._lock:
+            return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    # Score Derived from the Text Being Scored, So Reruns Agree
+    @staticmethod
+    def _entry(text):
+        score = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16) % 101
+        return {"score": score, "strengths": ["Stub strength"], "weaknesses": [], "recommendation": "Stub response."}
+
+    # Section prompts: short upper-case lines without digits are headers
+    @staticmethod
+    def _sections(lines):
+        headers = []
+        for line in lines:
+            idx, text = NUMBERED_LINE_RE.match(line).groups()
+            text = text.strip()
+            if text and len(text.split()) <= 4 and not any(c.isdigit() for c in text) and text.isupper():
+                section = next((name for name in STUB_SECTIONS if name[:5] in text.lower()), "others")
+                headers.append({"line": int(idx), "section": section})
+        return {"body_start": headers[0]["line"] if headers else len(lines), "headers": headers}
+
+    # Section prompts get line indices; batch prompts one entry per candidate ID, minus any dropped ones
+    def _reply(self, messages):
+        lines = messages[-1].content.splitlines()
+        if lines and all(NUMBERED_LINE_RE.match(line) for line in lines):
+            return json.dumps(self._sections(lines))
+        ids = CANDIDATE_ID_RE.findall(messages[-1].content)
+        if not ids:
+            return json.dumps(self._entry(messages[-1].content))
+        with self._lock:
+            kept = [i for i in ids if self._random.random() >= self.drop_rate]
+        return json.dumps({"results": [{"id": i, **self._entry(i)} for i in kept]})
+
+    def _usage(self, messages, reply):
+        tokens = [len(m.content) // 4 + 1 for m in messages]
+        usage = {"input_tokens": sum(tokens), "output_tokens": len(reply) // 4 + 1}
+        if not self.prefix_cache:
+            return usage, 0.0
+        prefix = hashlib.sha256("\x00".join(m.content for m in messages[:-1]).encode("utf-8")).hexdigest()
+        with self._lock:
+            self.prefixes.append(prefix)
+            hit = prefix in self._seen
+            self._seen.add(prefix)
+        cached = sum(tokens[:-1]) if hit else 0
+        usage["input_token_details"] = {"cache_read": cached}
+        return usage, self.cached_speedup * cached / sum(tokens)
+
+    # A per-request timeout ends the call like an HTTP client timeout would
+    def invoke(self, messages, timeout=None, **kwargs):
+        with self._lock:
+            self.calls += 1
+        reply = self._reply(messages)
+        usage, saved = self._usage(messages, reply)
+        tokens = usage["input_tokens"]
+        duration = self._duration() * (1 - saved) + self.token_latency * tokens / 1000
+        if timeout is not None and duration > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"Request timed out after {timeout} seconds")
+        time.sleep(duration)
+        return SimpleNamespace(content=reply, usage_metadata=usage)
+
+    # First chunk after first_token seconds, the rest spread over the remaining latency
+    def stream(self, messages, **kwargs):
+        with self._lock:
+            self.calls += 1
+        reply = self._reply(messages)
+        usage, _ = self._usage(messages, reply)
+        total = self._duration()
+        time.sleep(min(self.first_token, total))
+        step = max(0.0, total - self.first_token) / max(1, self.chunks - 1)
+        size = max(1, -(-len(reply) // self.chunks))
+        for i in range(0, len(reply), size):
+            if i:
+                time.sleep(step)
+            last = i + size >= len(reply)
+            yield SimpleNamespace(content=reply[i : i + size], usage_metadata=usage if last else None)
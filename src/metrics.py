@@ -0,0 +1,155 @@
+import os
+import json
+import time
+import functools
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+# Off Unless Asked For, So Instrumented Code Pays Only a Flag Check
+ENABLED = os.environ.get("HR_APP_METRICS", "").lower() in ("1", "true", "yes")
+MAX_SAMPLES = 2048
+
+_lock = threading.Lock()
+_samples = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+_totals = defaultdict(lambda: [0, 0.0])
+_counters = defaultdict(float)
+
+def enable(flag=True):
+    global ENABLED
+    ENABLED = bool(flag)
+
+def is_enabled():
+    return ENABLED
+
+def record(stage, seconds):
+    with _lock:
+        _samples[stage].append(seconds)
+        total = _totals[stage]
+        total[0] += 1
+        total[1] += seconds
+
+def count(name, value=1, stage=""):
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[(name, stage)] += value
+
+@contextmanager
+def timer(stage):
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start)
+
+# Decorator Timing Every Call of a Function Under the Given Stage Name
+def timed(stage):
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+# Per-Stage Summary: Call Count, Total Seconds and Percentiles over Recent Samples
+def snapshot():
+    with _lock:
+        samples = {stage: sorted(values) for stage, values in _samples.items()}
+        totals = {stage: tuple(total) for stage, total in _totals.items()}
+        counters = dict(_counters)
+
+    stages = {}
+    for stage, values in sorted(samples.items()):
+        calls, seconds = totals[stage]
+        stages[stage] = {
+            "count": calls,
+            "total_seconds": seconds,
+            "p50": _percentile(values, 0.50),
+            "p95": _percentile(values, 0.95),
+            "max": values[-1] if values else 0.0,
+        }
+    return {
+        "stages": stages,
+        "counters": [
+            {"name": name, "stage": stage, "value": value}
+            for (name, stage), value in sorted(counters.items())
+        ],
+    }
+
+def reset():
+    with _lock:
+        _samples.clear()
+        _totals.clear()
+        _counters.clear()
+
+# Raw State Handed Back from Worker Processes and Merged into This One
+def drain():
+    with _lock:
+        state = {
+            "samples": {stage: list(values) for stage, values in _samples.items()},
+            "totals": {stage: list(total) for stage, total in _totals.items()},
+            "counters": list(_counters.items()),
+        }
+        _samples.clear()
+        _totals.clear()
+        _counters.clear()
+    return state
+
+def merge(state):
+    if not state:
+        return
+    with _lock:
+        for stage, values in state["samples"].items():
+            _samples[stage].extend(values)
+        for stage, (calls, seconds) in state["totals"].items():
+            _totals[stage][0] += calls
+            _totals[stage][1] += seconds
+        for key, value in state["counters"]:
+            _counters[tuple(key)] += value
+
+def to_json(indent=2):
+    return json.dumps(snapshot(), indent=indent)
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+# Prometheus Text Exposition Format
+def to_prometheus(prefix="hr_app"):
+    snap = snapshot()
+    lines = [
+        f"# HELP {prefix}_stage_seconds Time spent per pipeline stage.",
+        f"# TYPE {prefix}_stage_seconds summary",
+    ]
+    for stage, s in snap["stages"].items():
+        label = f'stage="{_label(stage)}"'
+        lines.append(f'{prefix}_stage_seconds{{{label},quantile="0.5"}} {s["p50"]:.6f}')
+        lines.append(f'{prefix}_stage_seconds{{{label},quantile="0.95"}} {s["p95"]:.6f}')
+        lines.append(f"{prefix}_stage_seconds_sum{{{label}}} {s['total_seconds']:.6f}")
+        lines.append(f"{prefix}_stage_seconds_count{{{label}}} {s['count']}")
+
+    names = sorted({c["name"] for c in snap["counters"]})
+    for name in names:
+        metric = f"{prefix}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        for c in snap["counters"]:
+            if c["name"] == name:
+                lines.append(f'{metric}{{stage="{_label(c["stage"])}"}} {c["value"]:g}')
+    return "\n".join(lines) + "\n"
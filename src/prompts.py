@@ -0,0 +1,133 @@
+import os
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+import metrics
+from rate_limit import estimate_tokens
+
+# Token Budgets, Overridable per Deployment
+JD_TOKEN_BUDGET = int(os.environ.get("HR_APP_JD_TOKENS", "800"))
+SECTION_TOKEN_BUDGET = int(os.environ.get("HR_APP_SECTION_TOKENS", "400"))
+RESUME_TOKEN_BUDGET = int(os.environ.get("HR_APP_RESUME_TOKENS", "1500"))
+
+RESUME_SECTIONS = ["Education", "Experience", "Skills", "Others"]
+TRUNCATION_MARK = " …"
+
+# Markdown Only: Headings Start a Line, Emphasis Wraps Words; C#, F# and snake_case Are Left Alone
+MARKDOWN_HEADING_RE = re.compile(r"^[ \t]*#{1,6}[ \t]+", re.MULTILINE)
+MARKDOWN_BULLET_RE = re.compile(r"^([ \t]*)[*+][ \t]+", re.MULTILINE)
+MARKDOWN_EMPHASIS_RE = re.compile(r"(?<![\w*])(\*{1,3}|_{1,3})(?![\s*_])(.+?)(?<![\s*_])\1(?![\w*])")
+
+SPACES_RE = re.compile(r" {2,}")
+NEWLINE_SPACE_RE = re.compile(r"\n\s+")
+
+def clean_text(text: str) -> str:
+    if not isinstance(text, str):
+        return ""
+    text = text.replace('\\n', '\n')
+    text = text.replace('\t', ' ')
+    text = SPACES_RE.sub(' ', text)
+    text = NEWLINE_SPACE_RE.sub('\n', text)
+    text = text.strip()
+    return text
+
+# Cut Text to Roughly `budget` Tokens, at a Line Break Where One Is Close
+def truncate_tokens(text, budget):
+    if budget is None or estimate_tokens(text) <= budget:
+        return text
+    limit = max(0, budget * 4 - len(TRUNCATION_MARK))
+    cut = text.rfind("\n", 0, limit)
+    if cut < limit // 2:
+        cut = limit
+    return text[:cut].rstrip() + TRUNCATION_MARK
+
+# Vectorised clean_text: a Column Is Cleaned as One NUL-Joined String, Then Split Back into Rows
+def clean_series(series):
+    text = [value if isinstance(value, str) else "" for value in series]
+    blob = "\x00".join(text).replace("\\n", "\n").replace("\t", " ")
+    rows = NEWLINE_SPACE_RE.sub("\n", SPACES_RE.sub(" ", blob)).split("\x00")
+    # A NUL inside a value would shift the rows, so such columns are cleaned row by row
+    if len(rows) != len(text):
+        rows = [clean_text(value) for value in text]
+    return pd.Series([row.strip() for row in rows], index=series.index, name=series.name, dtype=object)
+
+# Vectorised truncate_tokens: Only Rows Over Budget Are Cut, Each Exactly as truncate_tokens Would
+def truncate_series(series, budget):
+    too_long = series.str.len() >= budget * 4
+    if not too_long.any():
+        return series
+    return series.mask(too_long, series[too_long].map(lambda text: truncate_tokens(text, budget)))
+
+# Join the Non-Empty Parts of Each Row with sep
+def join_nonempty(parts, sep):
+    joined = None
+    for part in parts:
+        if joined is None:
+            joined = part
+            continue
+        glue = joined.where(joined.eq(""), joined + sep)
+        joined = joined.where(part.eq(""), glue + part)
+    return joined
+
+# Resume Sections as Sent to the LLM, for a Column of Cleaned Sections: Labelled and Budgeted per Section
+def resume_text_column(sections, section_budget=SECTION_TOKEN_BUDGET):
+    sections = dict(sections)
+    # extract_resume_body falls back to a copy of Experience when there is no Skills section
+    sections["Skills"] = sections["Skills"].where(sections["Skills"] != sections["Experience"], "")
+    parts = []
+    for section in RESUME_SECTIONS:
+        text = truncate_series(sections[section], section_budget)
+        parts.append(text.where(text.eq(""), f"{section}:\n" + text))
+    return join_nonempty(parts, "\n\n")
+
+def _field(record, name):
+    value = record.get(name) if hasattr(record, "get") else None
+    if isinstance(value, (list, tuple)):
+        value = "\n".join(map(str, value))
+    return value if isinstance(value, str) else ""
+
+# The Same Text for Records Outside a Candidate Table, e.g. the CLI's Output Rows
+def resume_payloads(records, section_budget=SECTION_TOKEN_BUDGET):
+    records = list(records)
+    sections = {section: clean_series(pd.Series([_field(record, section) for record in records], dtype=object))
+                for section in RESUME_SECTIONS}
+    return list(resume_text_column(sections, section_budget)) if records else []
+
+def resume_payload(record, section_budget=SECTION_TOKEN_BUDGET):
+    return resume_payloads([record], section_budget)[0]
+
+# Free-Text Resume, e.g. Pasted on the Interview Page; Repeated Lines Are Kept, They May Be Separate Roles
+def compact_resume(text, budget=RESUME_TOKEN_BUDGET):
+    return truncate_tokens(clean_text(str(text or "")), budget)
+
+# Compact JD Computed Once and Shared by Every Candidate Scored Against It
+@lru_cache(maxsize=64)
+def compact_job_description(job_description, budget=JD_TOKEN_BUDGET):
+    text = MARKDOWN_HEADING_RE.sub("", str(job_description or ""))
+    text = MARKDOWN_BULLET_RE.sub(r"\1- ", text)
+    text = MARKDOWN_EMPHASIS_RE.sub(r"\2", text).replace("`", "")
+    return truncate_tokens(clean_text(text), budget)
+
+# Compact Both Inputs and Count Tokens Before and After, per Agent
+def compact_inputs(job_description, candidate_resume, agent=""):
+    job_description = str(job_description or "")
+    candidate_resume = str(candidate_resume or "")
+    compact_jd = compact_job_description(job_description)
+    compact_cv = compact_resume(candidate_resume)
+
+    metrics.count("input_tokens_raw", estimate_tokens(job_description) + estimate_tokens(candidate_resume), stage=agent)
+    metrics.count("input_tokens_compact", estimate_tokens(compact_jd) + estimate_tokens(compact_cv), stage=agent)
+    return compact_jd, compact_cv
+
+# One JD Shared by Several Resumes in a Single Prompt
+def compact_batch_inputs(job_description, candidate_resumes, agent=""):
+    job_description = str(job_description or "")
+    candidate_resumes = [str(resume or "") for resume in candidate_resumes]
+    compact_jd = compact_job_description(job_description)
+    compact_cvs = [compact_resume(resume) for resume in candidate_resumes]
+
+    metrics.count("input_tokens_raw", estimate_tokens(job_description) + sum(map(estimate_tokens, candidate_resumes)), stage=agent)
+    metrics.count("input_tokens_compact", estimate_tokens(compact_jd) + sum(map(estimate_tokens, compact_cvs)), stage=agent)
+    return compact_jd, compact_cvs
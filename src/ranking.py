@@ -0,0 +1,97 @@
+import re
+import math
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+# First-Stage Settings
+DEFAULT_TOP_K = 20
+DEFAULT_KEYWORDS = 30
+SIMILARITY_WEIGHT = 0.7
+RANKING_COLUMNS = ["Education", "Experience", "Skills"]
+
+# Keep Skill Tokens Like c++, c#, node.js and ci/cd Intact
+TOKEN_RE = re.compile(r"[a-z][a-z0-9+#./-]*[a-z0-9+#]|[a-z]")
+STOP_WORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can could did do does
+during each either etc for from had has have having he her here his how i if in into is it its itself
+just may me might more most must my no nor not of on once only or other our ours out over own per she
+should so some such than that the their them then there these they this those through to too under
+until up us very via was we were what when where which while who whom why will with within without
+would you your yours role team work working years year experience looking join strong ability
+""".split())
+
+def tokenize(text):
+    if not isinstance(text, str):
+        return []
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOP_WORDS]
+
+# TF-IDF Cosine Similarity and Keyword Overlap Between the JD and Each Document
+def tfidf_scores(job_description, documents, n_keywords=DEFAULT_KEYWORDS):
+    jd_counts = Counter(tokenize(job_description))
+    doc_counts = [Counter(tokenize(doc)) for doc in documents]
+    n_docs = len(doc_counts)
+    if not jd_counts or n_docs == 0:
+        return np.zeros(n_docs), np.zeros(n_docs)
+
+    # Smoothed idf over the candidate pool plus the JD
+    doc_freq = Counter(jd_counts.keys())
+    for counts in doc_counts:
+        doc_freq.update(counts.keys())
+    n_total = n_docs + 1
+    idf = {term: math.log((1 + n_total) / (1 + freq)) + 1.0 for term, freq in doc_freq.items()}
+
+    # Only JD terms contribute to the dot product, so the matrix stays |pool| x |JD vocabulary|
+    vocab = list(jd_counts)
+    column = {term: j for j, term in enumerate(vocab)}
+    idf_vec = np.array([idf[term] for term in vocab])
+    jd_vec = np.array([jd_counts[term] for term in vocab], dtype=float) * idf_vec
+
+    matrix = np.zeros((n_docs, len(vocab)))
+    doc_norms = np.zeros(n_docs)
+    for i, counts in enumerate(doc_counts):
+        for term, count in counts.items():
+            j = column.get(term)
+            if j is not None:
+                matrix[i, j] = count
+        # Norm over the document's full tf-idf vector, not just the shared terms
+        doc_norms[i] = math.sqrt(sum((count * idf[term]) ** 2 for term, count in counts.items()))
+    matrix *= idf_vec
+
+    denom = doc_norms * np.linalg.norm(jd_vec)
+    similarity = np.divide(matrix @ jd_vec, denom, out=np.zeros(n_docs), where=denom > 0)
+
+    # Keyword overlap: share of the JD's highest-weighted terms the document mentions
+    keywords = np.argsort(-jd_vec, kind="stable")[:n_keywords]
+    overlap = (matrix[:, keywords] > 0).mean(axis=1)
+    return similarity, overlap
+
+# Rank Candidates Locally and Mark the Top-K for LLM Scoring
+def prefilter_candidates(job_description, candidates_df, top_k=DEFAULT_TOP_K, columns=RANKING_COLUMNS,
+                         similarity_weight=SIMILARITY_WEIGHT):
+    present = [col for col in columns if col in candidates_df.columns]
+    if present:
+        texts = candidates_df[present].fillna("").astype(str).agg("\n".join, axis=1).tolist()
+    else:
+        texts = [""] * len(candidates_df)
+
+    similarity, overlap = tfidf_scores(job_description, texts)
+    ranked = pd.DataFrame(
+        {
+            "similarity": similarity,
+            "keyword_overlap": overlap,
+            "prefilter_score": similarity_weight * similarity + (1 - similarity_weight) * overlap,
+        },
+        index=candidates_df.index,
+    )
+    if "name" in candidates_df.columns:
+        ranked.insert(0, "name", candidates_df["name"])
+
+    ranked = ranked.sort_values("prefilter_score", ascending=False, kind="stable")
+    ranked["selected"] = False
+    if top_k:
+        ranked.iloc[: int(top_k), ranked.columns.get_loc("selected")] = True
+    else:
+        ranked["selected"] = True
+    return ranked
@@ -0,0 +1,188 @@
+import os
+import time
+import random
+import asyncio
+import functools
+import threading
+
+# Provider Limits, Overridable per Deployment
+DEFAULT_REQUESTS_PER_MINUTE = int(os.environ.get("HR_APP_RPM", "30"))
+DEFAULT_TOKENS_PER_MINUTE = int(os.environ.get("HR_APP_TPM", "12000"))
+DEFAULT_COMPLETION_TOKENS = 500
+
+# Backoff Settings
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Rough Token Count: About Four Characters per Token for English Text
+def estimate_tokens(text):
+    return len(text or "") // 4 + 1
+
+# Refilling Bucket, Not Locked Itself: the Limiter Owns the Lock
+class TokenBucket:
+    def __init__(self, capacity, per_second):
+        self.capacity = float(capacity)
+        self.per_second = float(per_second)
+        self.level = float(capacity)
+        self.updated = time.monotonic()
+
+    def refill(self, now, scale=1.0):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.per_second * scale)
+        self.updated = now
+
+    def wait_time(self, amount, scale=1.0):
+        missing = min(amount, self.capacity) - self.level
+        return 0.0 if missing <= 0 else missing / (self.per_second * scale)
+
+    def take(self, amount):
+        self.level -= min(amount, self.capacity)
+
+# Shared Requests/Min and Tokens/Min Limiter, Safe for Threads and asyncio
+class RateLimiter:
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, tokens_per_minute=DEFAULT_TOKENS_PER_MINUTE):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self._lock = threading.Lock()
+
+        # Adaptive rate: halved on throttling, recovers a little with every success
+        self.scale = 1.0
+        self.min_scale = 0.1
+        self.cooldown_until = 0.0
+
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def _reserve(self, tokens):
+        # Returns 0 once the request is admitted, otherwise how long to wait before asking again
+        with self._lock:
+            now = time.monotonic()
+            if now < self.cooldown_until:
+                return self.cooldown_until - now
+            self.requests.refill(now, self.scale)
+            self.tokens.refill(now, self.scale)
+            wait = max(self.requests.wait_time(1, self.scale), self.tokens.wait_time(tokens, self.scale))
+            if wait <= 0:
+                self.requests.take(1)
+                self.tokens.take(tokens)
+            return wait
+
+    # Time Actually Spent Waiting, Measured Once per Call; Planned Waits Overlap When _reserve Loops
+    def _record_wait(self, seconds):
+        with self._lock:
+            self.waited_seconds += seconds
+
+    def acquire(self, tokens=1):
+        start = None
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                if start is not None:
+                    self._record_wait(time.perf_counter() - start)
+                return
+            start = time.perf_counter() if start is None else start
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=1):
+        start = None
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                if start is not None:
+                    self._record_wait(time.perf_counter() - start)
+                return
+            start = time.perf_counter() if start is None else start
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self.scale = min(1.0, self.scale + 0.05)
+
+    def on_throttle(self, delay):
+        # Every caller pauses, not just the one that was rejected
+        with self._lock:
+            self.throttled += 1
+            self.scale = max(self.min_scale, self.scale / 2)
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + delay)
+
+    def stats(self):
+        return {"throttled": self.throttled, "waited_seconds": self.waited_seconds, "rate_scale": self.scale}
+
+def status_code(exc):
+    code = getattr(exc, "status_code", None)
+    if code is None:
+        code = getattr(getattr(exc, "response", None), "status_code", None)
+    return code
+
+def is_retryable(exc):
+    return status_code(exc) in RETRYABLE_STATUS
+
+# Client Errors for a Request That Timed Out or Never Reached the Server; Imported Lazily as Either Client May Be Missing
+@functools.lru_cache(maxsize=1)
+def _transient_errors():
+    errors = [TimeoutError, ConnectionError]
+    try:
+        import httpx
+        errors.append(httpx.TransportError)
+    except ImportError:
+        pass
+    try:
+        import groq
+        errors.append(groq.APIConnectionError)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+def is_transient(exc):
+    return isinstance(exc, _transient_errors())
+
+# Server-Provided Retry-After in Seconds, If Any
+def retry_after(exc):
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(exc, attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    # Full jitter, but never sooner than the server asked for
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    return max(delay, retry_after(exc) or 0.0)
+
+# Call fn Through the Limiter, Backing Off on 429 and 5xx
+def call_with_backoff(fn, limiter, tokens=1, max_retries=MAX_RETRIES):
+    attempt = 0
+    while True:
+        limiter.acquire(tokens)
+        try:
+            result = fn()
+        except Exception as e:
+            if not is_retryable(e) or attempt >= max_retries:
+                raise
+            delay = backoff_delay(e, attempt)
+            if status_code(e) == 429:
+                limiter.on_throttle(delay)
+            time.sleep(delay)
+            attempt += 1
+            continue
+        limiter.on_success()
+        return result
+
+async def acall_with_backoff(coro_fn, limiter, tokens=1, max_retries=MAX_RETRIES):
+    attempt = 0
+    while True:
+        await limiter.acquire_async(tokens)
+        try:
+            result = await coro_fn()
+        except Exception as e:
+            if not is_retryable(e) or attempt >= max_retries:
+                raise
+            delay = backoff_delay(e, attempt)
+            if status_code(e) == 429:
+                limiter.on_throttle(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        limiter.on_success()
+        return result
@@ -1,9 +1,10 @@
 import re
-import json
+import threading
 import pypdfium2 as pdfium
-import spacy
 from difflib import SequenceMatcher
 from collections import defaultdict
+from functools import lru_cache
+from contextlib import nullcontext
 
 import tempfile
 import random
@@ -12,30 +13,122 @@ from collections import Counter
 import os, sys
 import shutil
 import glob
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import numpy as np
 import pandas as pd
 
-# Load Spacy Model
-nlp = spacy.load("en_core_web_sm")
+import metrics
+from resume_store import pdf_hash
+
+# Bump Whenever a Change Alters Parsed Output, so Stored Results Are Re-Parsed
+PARSER_VERSION = "3"
+
+# Resumes Scoring Below This Go to the LLM Section Fallback, When It Is On
+SECTION_CONFIDENCE_THRESHOLD = float(os.environ.get("HR_APP_SECTION_CONFIDENCE", "0.6"))
+SECTION_FALLBACK_WORKERS = 4
+
+# Numbered-Line Payload Limits for the LLM Section Fallback; Titles Are Short, So Lines Are Cut Early
+FALLBACK_MAX_LINES = 250
+FALLBACK_LINE_CHARS = 32
+
+# Spacy Model, Loaded Lazily on First Use
+SPACY_MODEL = "en_core_web_sm"
+SPACY_EXCLUDE = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+_nlp = None
+_nlp_lock = threading.Lock()
+
+def get_nlp():
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                import spacy
+                _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+    return _nlp
+
+# Pages Header NER Looks At; Section Splitting Still Reads the Whole Document
+HEADER_MAX_PAGES = 2
+
+# Read-Only File-Like View over a Buffer (mmap, memoryview, bytearray) without Copying It Whole
+class _BufferReader:
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def seek(self, offset, whence=0):
+        base = {0: 0, 1: self._pos, 2: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos : end].tobytes()
+        self._pos = end
+        return data
+
+    def readinto(self, buffer):
+        target = memoryview(buffer).cast("B")
+        n = min(len(target), len(self._view) - self._pos)
+        target[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self):
+        # Drop the export so the caller can close its mmap
+        self._view.release()
+
+# Open a PDF from Raw Bytes, a Path, a Memory-Mapped Buffer or a Binary File Object
+def _open_pdf(source):
+    if isinstance(source, (str, os.PathLike)):
+        return pdfium.PdfDocument(os.fspath(source))
+    if isinstance(source, bytes):
+        return pdfium.PdfDocument(source)
+    if hasattr(source, "readinto") and hasattr(source, "seek"):
+        return pdfium.PdfDocument(source)
+    return pdfium.PdfDocument(_BufferReader(source), autoclose=True)
+
+# Yield the PDF's Lines Page by Page, Releasing Every pdfium Handle as Soon as It Is Read
+# page_ends, when given, collects the number of lines yielded by the end of each page
+def iter_pdf_lines(resume, max_pages=None, page_ends=None):
+    pdf = _open_pdf(resume)
+    try:
+        n_pages = len(pdf) if max_pages is None else min(len(pdf), max_pages)
+
+        # A line can run across a page break, so the last piece waits for the next page
+        carry = ""
+        for i in range(n_pages):
+            page = pdf[i]
+            try:
+                textpage = page.get_textpage()
+                try:
+                    text = textpage.get_text_bounded()
+                finally:
+                    textpage.close()
+            finally:
+                page.close()
+
+            lines = (carry + text).split("\r\n")
+            carry = lines.pop()
+            yield from lines
+            if page_ends is not None:
+                page_ends.append((page_ends[-1] if page_ends else 0) + len(lines))
+        yield carry
+    finally:
+        pdf.close()
 
 # Parse PDF
-def parse_pdf(resume):
-    
-    # Parse Document
-    pdf = pdfium.PdfDocument(resume)
-    n_pages = len(pdf)  
-
-    # Loop Through and Extract All Text into a Single String
-    text_final = ""
-    for i in range(n_pages):
-        page = pdf[i]
-        textpage = page.get_textpage()
-        text_all = textpage.get_text_range()
-        text_final += text_all
-
-    text_final_list = text_final.split("\r\n")
-    
-    return text_final_list
+@metrics.timed("parse_pdf")
+def parse_pdf(resume, max_pages=None, page_ends=None):
+    return list(iter_pdf_lines(resume, max_pages, page_ends))
+
+# Lines on the First max_pages Pages; Header NER Never Looks Past Them, Even When No Section Header Was Found
+def header_line_limit(page_ends, max_pages=HEADER_MAX_PAGES):
+    return page_ends[max_pages - 1] if len(page_ends) > max_pages else None
 
 # Define the Taxonomy
 eng_taxonomy = {
@@ -95,16 +188,84 @@ def normalize_header(header: str, taxonomy: dict, flat_list: list, threshold: fl
         return best_cat, best_score
     return None, best_score
 
+# Precompiled Header Classifier, Returns the Same (cat, score) as normalize_header
+class HeaderClassifier:
+    def __init__(self, taxonomy: dict, cache_size: int = 4096):
+        self.categories = list(taxonomy)
+        self.flat_list = [(syn.lower(), cat) for cat, syns in taxonomy.items() for syn in syns]
+
+        # One alternation for all category keywords
+        self.keyword_re = re.compile(r"\b(" + "|".join(re.escape(cat) for cat in self.categories) + r")\b")
+
+        # Synonyms indexed by length, the length pair bounds the best achievable ratio
+        self.by_length = defaultdict(list)
+        for order, (syn, cat) in enumerate(self.flat_list):
+            self.by_length[len(syn)].append((order, syn, cat))
+
+        # Matchers are per thread because SequenceMatcher keeps state between calls
+        self._local = threading.local()
+        self.classify = metrics.timed("normalize_header")(lru_cache(maxsize=cache_size)(self._classify))
+
+    def _matchers(self):
+        matchers = getattr(self._local, "matchers", None)
+        if matchers is None:
+            # seq2 is the synonym, so its index is built once and reused for every header
+            matchers = [SequenceMatcher(None, "", syn) for syn, _ in self.flat_list]
+            self._local.matchers = matchers
+        return matchers
+
+    def _classify(self, header: str, threshold: float = 0.6):
+        h = header.lower()
+
+        # Direct keyword precedence, first category in taxonomy order wins
+        found = set(self.keyword_re.findall(h))
+        if found:
+            for cat in self.categories:
+                if cat in found:
+                    return cat, 1.0
+
+        # Fuzzy match only synonyms whose length still allows beating the best score
+        len_h = len(h)
+        shortlist = sorted(
+            ((2.0 * min(len_h, length) / (len_h + length), length) for length in self.by_length if len_h + length),
+            reverse=True,
+        )
+        matchers = self._matchers()
+        best_cat, best_score, best_order = None, 0.0, len(self.flat_list)
+        for bound, length in shortlist:
+            if bound < best_score:
+                break
+            for order, syn, cat in self.by_length[length]:
+                # Ties go to the synonym listed first, as in the plain linear scan
+                if bound == best_score and order > best_order:
+                    continue
+                matcher = matchers[order]
+                matcher.set_seq1(h)
+                if matcher.quick_ratio() < best_score:
+                    continue
+                score = matcher.ratio()
+                if score > best_score or (score == best_score and score > 0 and order < best_order):
+                    best_cat, best_score, best_order = cat, score, order
+
+        if best_score >= threshold:
+            return best_cat, best_score
+        return None, best_score
+
+eng_header_classifier = HeaderClassifier(eng_taxonomy)
+
+# Header Heuristic: No Digits Anywhere in the Line
+no_digits_re = re.compile(r'^[^0-9]*$')
+
 # Extract the Resume Header, Resume Body and Resume Body Sections
+@metrics.timed("extract_sections")
 def extract_sections(text_final_list, threshold: float = 0.5):
     resume_body_headers = []
     resume_body_start_idx = None
 
     for idx, item in enumerate(text_final_list):
         # header heuristic: no '|', no dots, no full stops, no numbers and shorter than max taxonomy
-        no_digits_re = re.compile(r'^[^0-9]*$')
         if "|" not in item and "・" not in item and "。" not in item and no_digits_re.match(item) and len(item.split()) <= max_len_eng:
-            cat, score = normalize_header(item, eng_taxonomy, flat_list_eng, threshold)
+            cat, score = eng_header_classifier.classify(item, threshold)
             if score > threshold:
                 if resume_body_start_idx is None:
                     resume_body_start_idx = idx
@@ -118,69 +279,98 @@ def extract_sections(text_final_list, threshold: float = 0.5):
     resume_body   = text_final_list[resume_body_start_idx:]
     return resume_header, resume_body, resume_body_headers
 
-# Fallback: Extract Resume Using LLM
-def extract_sections_llm(client, text_final_list):
-    context_prompt = f"""
-
-        You are an expert resume section extractor.
-
-        Your task is as follows:
-        1. Read the resume carefully. Each string represents a line.
-        2. Extract the following:
-            - resume_header: This variable should contain all lines that constitute the introductory part of the resume. This typically includes the candidate's name, contact information (phone, email, LinkedIn, portfolio link), and sometimes a brief summary or objective statement if present at the very beginning.
-            - resume_body: This variable should contain all lines that make up the main content of the resume, excluding the header. This includes sections like "Experience," "Education," "Skills," "Projects," "Awards," etc., along with their corresponding details.
-            - resume_body_headers: This variable should contain only the main section titles found within the resume_body. These are typically headings that introduce major sections of the resume (e.g., "EXPERIENCE", "EDUCATION", "SKILLS", "PROJECTS").
-        3. Return your answer as a JSON array of objects with three keys
-            - "resume_header"
-            - "resume_body"
-            - "resume_body_headers"
-            
-        Input:
-        {text_final_list}
-        
-        Output:
-    """
-
-    response = client.models.generate_content(
-        model="gemini-2.0-flash",
-         contents=context_prompt,
-        config={
-            'response_mime_type': 'application/json',
-        },
-    )
-
-    output = response.text
-    
-    try:
-        parsed_output = json.loads(output)
-        
-        # Check if the parsed output is a list containing a single dictionary
-        if isinstance(parsed_output, list) and len(parsed_output) == 1 and isinstance(parsed_output[0], dict):
-            final_dict = parsed_output[0] # Extract the dictionary from the list
-        elif isinstance(parsed_output, dict):
-            final_dict = parsed_output # It's already the dictionary
-        else:
-            raise ValueError(
-                f"Model returned unexpected JSON structure. Expected a dictionary or a list containing one dictionary, got: {type(parsed_output)}"
-            )
+# Core Sections a Well-Parsed Resume Is Expected to Have
+CORE_SECTIONS = ("experience", "education", "skills")
+
+# How Far to Trust extract_sections: Header Match Quality, Core Sections Found and Intro Length
+def section_confidence(text_final_list, resume_header, resume_body, resume_body_headers, threshold: float = 0.5):
+    if not text_final_list or not resume_body_headers:
+        return 0.0
+
+    # Exact keywords score 1.0 in normalize_header, fuzzy matches less
+    match = sum(eng_header_classifier.classify(item, threshold)[1] for _, item, _ in resume_body_headers) / len(resume_body_headers)
+    found = {cat for _, _, cat in resume_body_headers}
+    coverage = sum(cat in found for cat in CORE_SECTIONS) / len(CORE_SECTIONS)
+    confidence = match * (0.5 + 0.5 * coverage)
+
+    # Most of the text before the first header means the real headers were missed
+    if len(resume_header) > len(text_final_list) / 2:
+        confidence *= 0.5
+    return confidence
+
+# Compact LLM Payload: "<index>:<text>" per Line, Cut to line_chars
+# Blank lines and all but the first of a run of long lines are left out; headers are short, so none are lost
+def numbered_lines(text_final_list, max_lines=FALLBACK_MAX_LINES, line_chars=FALLBACK_LINE_CHARS):
+    out, in_run = [], False
+    for idx, item in enumerate(text_final_list[:max_lines]):
+        item = item.strip()
+        if not item:
+            continue
+        is_long = len(item) > line_chars
+        if not (is_long and in_run):
+            out.append(f"{idx}:{item[:line_chars]}")
+        in_run = is_long
+    return "\n".join(out)
+
+# Map the LLM's Line Indices Back onto the Lines; Out-of-Range or Malformed Entries Are Dropped
+def sections_from_indices(text_final_list, data):
+    def as_index(value):
+        if isinstance(value, str) and value.strip().isdigit():
+            value = int(value.strip())
+        if isinstance(value, int) and not isinstance(value, bool) and 0 <= value < len(text_final_list):
+            return value
+        return None
+
+    headers = {}
+    for entry in data.get("headers") or []:
+        idx = as_index(entry.get("line")) if isinstance(entry, dict) else None
+        if idx is None:
+            continue
+        cat = str(entry.get("section") or "").lower()
+        headers[idx] = (idx, text_final_list[idx], cat if cat in eng_taxonomy else "others")
+    resume_body_headers = [headers[idx] for idx in sorted(headers)]
 
-    except json.JSONDecodeError as e:
-        print(f"JSON Decode Error: {e}")
-        print(f"Problematic JSON string received:\n{output}")
-        raise ValueError("Model did not return valid JSON despite instructions.") from e
+    body_start = as_index(data.get("body_start"))
+    if resume_body_headers:
+        first = resume_body_headers[0][0]
+        body_start = first if body_start is None else min(body_start, first)
+    elif body_start is None:
+        body_start = len(text_final_list)
 
-    return final_dict.get("resume_header", []), final_dict.get("resume_body", []), final_dict.get("resume_body_headers", [])
+    return text_final_list[:body_start], text_final_list[body_start:], resume_body_headers
 
-def extract_name(lines):
+# Fallback: Extract Resume Using LLM
+def extract_sections_llm(text_final_list, cache_id=None, use_cache=True):
+    from agents import section_extraction_agent
+
+    data = section_extraction_agent(numbered_lines(text_final_list), cache_id=cache_id, use_cache=use_cache)
+    return sections_from_indices(text_final_list, data)
+
+# Pipeline Components Needed for NER: the Recognizer Plus Anything It Listens To
+def _ner_disabled_pipes(nlp):
+    needed = {"ner"}
+    for name in nlp.pipe_names:
+        if "ner" in getattr(nlp.get_pipe(name), "listening_components", []):
+            needed.add(name)
+    return [name for name in nlp.pipe_names if name not in needed]
+
+# Run Header Lines Through One NER-Only nlp.pipe Pass
+@metrics.timed("header_ner")
+def header_docs(lines, batch_size=256):
+    nlp = get_nlp()
+    return list(nlp.pipe((line.strip() for line in lines), disable=_ner_disabled_pipes(nlp), batch_size=batch_size))
+
+def extract_name(lines, docs=None):
     
     has_digit = re.compile(r"\d")
+    if docs is None:
+        docs = header_docs(lines)
     
     # Pass 1: NER
-    for line in lines:
+    for line, doc in zip(lines, docs):
         clean = line.strip()
         if has_digit.search(clean):
             continue
-        doc = nlp(clean)
         for ent in doc.ents:
             if ent.label_ == "PERSON":
                 return ent.text
@@ -195,84 +385,90 @@ def extract_name(lines):
 
     return ""
 
-def extract_location(lines):
+def extract_location(lines, docs=None):
+    
+    if docs is None:
+        docs = header_docs(lines)
         
     # Pass 1: NER
-    for line in lines:
-        clean = line.strip()
-        doc = nlp(clean)
+    for doc in docs:
         for ent in doc.ents:
             if ent.label_ == "GPE":
                 return ent.text
 
+# Contact Patterns, Compiled Once at Import
+EMAIL_RE = re.compile(r"([^@|\s]+@[^@]+\.[^@|\s]+)")
+MOBILE_RE = re.compile(
+    r'(?:(?:\+?([1-9]|[0-9][0-9]|[0-9][0-9][0-9])\s*(?:[.-]\s*)?)?(?:\(\s*([2-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9])\s*\)|([0-9][1-9]|[0-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9]))\s*(?:[.-]\s*)?)?([2-9]1[02-9]|[2-9][02-9]1|[2-9][02-9]{2})\s*(?:[.-]\s*)?([0-9]{4})(?:\s*(?:#|x\.?|ext\.?|extension)\s*(\d+))?')
+WEBSITE_RE = re.compile(r'\b(?:https?:\/\/)?(?:www\.)?[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:\/[^\s]*)?\b')
+DIGIT_RE = re.compile(r"\d")
+EMAIL_DOMAINS = ['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com', 'aol.com', '.edu']
+
 def extract_email(text):
-    email_content = re.findall("([^@|\s]+@[^@]+\.[^@|\s]+)", text)
+    email_content = EMAIL_RE.search(text)
     if email_content:
-        try:
-            return email_content[0].split()[0].strip(';')
-        except IndexError:
-            return None
+        return email_content.group(1).split()[0].strip(';')
 
 def extract_mobile(text):
-    mobile_no = re.findall(re.compile(
-        r'(?:(?:\+?([1-9]|[0-9][0-9]|[0-9][0-9][0-9])\s*(?:[.-]\s*)?)?(?:\(\s*([2-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9])\s*\)|([0-9][1-9]|[0-9]1[02-9]|[2-9][02-8]1|[2-9][02-8][02-9]))\s*(?:[.-]\s*)?)?([2-9]1[02-9]|[2-9][02-9]1|[2-9][02-9]{2})\s*(?:[.-]\s*)?([0-9]{4})(?:\s*(?:#|x\.?|ext\.?|extension)\s*(\d+))?'),
-        text)
+    mobile_no = MOBILE_RE.search(text)
     if mobile_no:
-        temp_number = ''.join(mobile_no[0])
+        temp_number = ''.join(mobile_no.groups(default=''))
         if len(temp_number) > 10:
             return '+' + temp_number
         else:
             return temp_number
 
 def extract_websites(text):
-    pattern = r'\b(?:https?:\/\/)?(?:www\.)?[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:\/[^\s]*)?\b'
-    urls = re.findall(pattern, text)
-    return urls
+    return WEBSITE_RE.findall(text)
+
+# One Pass over the Header: First Email, First Mobile and Every Website
+def scan_contacts(resume_header):
+    email = mobile = None
+    websites = []
+    consumed = set()
 
-def extract_personal_information(resume_header):
+    for item in resume_header:
+        # Each pattern needs a character the line may not have, so most lines skip the regex
+        if email is None and "@" in item:
+            email = extract_email(item)
+            if email:
+                consumed.add(item)
+        if mobile is None and DIGIT_RE.search(item):
+            mobile = extract_mobile(item)
+            if mobile:
+                consumed.add(item)
+        if "." in item:
+            # Filter out “websites” that are really just email domains
+            legit = [w for w in WEBSITE_RE.findall(item) if not any(d in w for d in EMAIL_DOMAINS)]
+            if legit:
+                websites.extend(legit)
+                consumed.add(item)
+
+    return email, mobile, websites, consumed
+
+@metrics.timed("extract_personal_information")
+def extract_personal_information(resume_header, docs=None):
     
     # Set to Remember Lines We Extracted
     consumed = set()
     
+    # Tag the Header Once and Share the Docs Between Name and Location
+    if docs is None:
+        docs = header_docs(resume_header)
+    
     # Extract Name
-    name = extract_name(resume_header)
+    name = extract_name(resume_header, docs)
     if name:
         consumed.add(name)
     
     # Extract Location
-    location = extract_location(resume_header)
+    location = extract_location(resume_header, docs)
     if location:
         consumed.add(location)
     
-    # Extrace Only One Email and Mobile
-    email = mobile = None
-    for item in resume_header:
-        if not email and extract_email(item):
-            email = extract_email(item)
-            consumed.add(item)
-        if not mobile and extract_mobile(item):
-            mobile = extract_mobile(item)
-            consumed.add(item)
-        if email and mobile:
-            break
-    
-    # Extract Website and Remove Email Address
-    websites = []
-    email_domains = ['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com', 'aol.com', '.edu']
-
-    for item in resume_header:
-        site = extract_websites(item)
-        if site:
-            # filter out “websites” that are really just email-domains
-            if isinstance(site, list):
-                legit = [w for w in site if not any(d in w for d in email_domains)]
-                if legit:
-                    websites.extend(legit)
-                    consumed.add(item)
-            else:
-                if not any(d in site for d in email_domains):
-                    websites.append(site)
-                    consumed.add(item)
+    # Extract Email, Mobile and Websites in a Single Pass
+    email, mobile, websites, contact_lines = scan_contacts(resume_header)
+    consumed |= contact_lines
     
     # Compile Consumed and Remove from Others
     others_list = [
@@ -294,8 +490,21 @@ def extract_personal_information(resume_header):
     ]
     
     return extracted_resume_intro
+
+# Extract Personal Information for Many Resumes with a Single nlp.pipe Call
+def extract_personal_information_batch(resume_headers):
+    all_docs = header_docs([line for header in resume_headers for line in header])
+
+    intros = []
+    offset = 0
+    for header in resume_headers:
+        docs = all_docs[offset : offset + len(header)]
+        offset += len(header)
+        intros.append(extract_personal_information(header, docs))
+    return intros
     
 # Extract Resume Body
+@metrics.timed("extract_resume_body")
 def extract_resume_body(text_final_list, resume_body, resume_body_headers):
     sections_by_cat = defaultdict(list)
     extended = resume_body_headers + [(len(text_final_list), None, None)]
@@ -344,3 +553,138 @@ def extract_resume_body(text_final_list, resume_body, resume_body_headers):
     ] 
     
     return extracted_resume_body
+
+# Intros and Bodies for Already-Split Resumes, Batching Header NER Across Them
+def _finish_resumes(parsed_list, sections, header_limits):
+    intros = extract_personal_information_batch([resume_header[:limit] for (resume_header, _, _), limit in zip(sections, header_limits)])
+    bodies = [
+        extract_resume_body(parsed, resume_body, resume_body_headers)
+        for parsed, (_, resume_body, resume_body_headers) in zip(parsed_list, sections)
+    ]
+    return list(zip(intros, bodies))
+
+# Parse and Split Every Resume; with defer_low_confidence, Low-Confidence Ones Skip NER and Come Back as (Position, Lines, Header Limit)
+# Positions of every low-confidence resume are returned too, deferred or not
+def _parse_resumes(list_of_bytes, defer_low_confidence=False):
+    parsed_list, sections, header_limits, positions, deferred, low_confidence = [], [], [], [], [], []
+    for pos, pdf_bytes in enumerate(list_of_bytes):
+        page_ends = []
+        parsed = parse_pdf(pdf_bytes, page_ends=page_ends)
+        header_limit = header_line_limit(page_ends)
+        resume_sections = extract_sections(parsed)
+        if parsed and section_confidence(parsed, *resume_sections) < SECTION_CONFIDENCE_THRESHOLD:
+            metrics.count("low_confidence_sections", stage="parse")
+            low_confidence.append(pos)
+            if defer_low_confidence:
+                deferred.append((pos, parsed, header_limit))
+                continue
+        parsed_list.append(parsed)
+        sections.append(resume_sections)
+        header_limits.append(header_limit)
+        positions.append(pos)
+
+    results = [None] * len(list_of_bytes)
+    for pos, result in zip(positions, _finish_resumes(parsed_list, sections, header_limits)):
+        results[pos] = result
+    return results, deferred, low_confidence
+
+# Run the Full Pipeline on Several Resumes, Batching Header NER Across Them
+def parse_resumes(list_of_bytes):
+    return _parse_resumes(list_of_bytes)[0]
+
+# LLM Sections for Low-Confidence Resumes, Called Concurrently; a Failed or Empty Reply Keeps the Rule-Based Split
+# Returns the results, whether each one was split by the LLM, and the failed calls' errors
+@metrics.timed("section_fallback")
+def parse_low_confidence(lines_list, header_limits, cache_ids, workers=SECTION_FALLBACK_WORKERS, use_cache=True):
+    def llm_sections(lines, cache_id):
+        try:
+            return extract_sections_llm(lines, cache_id=cache_id, use_cache=use_cache), None
+        except Exception as e:
+            metrics.count("section_fallback_errors", stage="parse")
+            return None, f"{type(e).__name__}: {e}"
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(lines_list)))) as executor:
+        replies, errors = zip(*executor.map(llm_sections, lines_list, cache_ids))
+
+    applied = [bool(reply and reply[2]) for reply in replies]
+    sections = [reply if ok else extract_sections(lines) for lines, reply, ok in zip(lines_list, replies, applied)]
+    return _finish_resumes(lines_list, sections, header_limits), applied, [error for error in errors if error]
+
+# Run the Full Pipeline on a Single Resume
+def parse_resume(pdf_bytes):
+    return parse_resumes([pdf_bytes])[0]
+
+# Process Pool Worker Setup: Load the Spacy Model Once per Worker
+def _init_parse_worker():
+    get_nlp()
+
+# Spawned Parse Workers; Callers Parsing in Batches Keep One Open and Pass It to parse_resumes_batch
+def parse_pool(workers):
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_parse_worker)
+
+# Timings Recorded in the Worker Travel Back with the Results
+def _parse_chunk_task(start, chunk, collect_metrics=False, defer_low_confidence=False):
+    metrics.enable(collect_metrics)
+    results, deferred, low_confidence = _parse_resumes(chunk, defer_low_confidence)
+    return start, results, deferred, low_confidence, metrics.drain() if collect_metrics else None
+
+# Parse Many Resumes in a Process Pool, Keeping Input Order
+# With llm_fallback, low-confidence resumes are re-split by the LLM in this process, so calls share one rate limiter
+# A passed executor is used as is and left open; otherwise a pool is started for this call
+# provisional collects the positions of low-confidence results the LLM did not re-split, fallback off or failed; don't store them
+def parse_resumes_batch(list_of_bytes, workers=None, progress_callback=None, chunk_size=8, hashes=None, llm_fallback=False,
+                        fallback_workers=SECTION_FALLBACK_WORKERS, stats=None, executor=None, provisional=None, use_cache=True):
+    total = len(list_of_bytes)
+    results = [None] * total
+    deferred, low_confidence = [], []
+    chunks = [(start, list_of_bytes[start : start + chunk_size]) for start in range(0, total, chunk_size)]
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    done = 0
+
+    # Small batches are cheaper in-process than paying for worker start-up
+    if executor is None and workers <= 1:
+        for start, chunk in chunks:
+            chunk_results, chunk_deferred, chunk_low = _parse_resumes(chunk, llm_fallback)
+            results[start : start + len(chunk)] = chunk_results
+            deferred.extend((start + pos, lines, limit) for pos, lines, limit in chunk_deferred)
+            low_confidence.extend(start + pos for pos in chunk_low)
+            done += len(chunk)
+            if progress_callback:
+                progress_callback(done, total)
+    else:
+        with parse_pool(workers) if executor is None else nullcontext(executor) as executor:
+            futures = [executor.submit(_parse_chunk_task, start, chunk, metrics.is_enabled(), llm_fallback) for start, chunk in chunks]
+            for future in as_completed(futures):
+                start, chunk_results, chunk_deferred, chunk_low, worker_metrics = future.result()
+                results[start : start + len(chunk_results)] = chunk_results
+                deferred.extend((start + pos, lines, limit) for pos, lines, limit in chunk_deferred)
+                low_confidence.extend(start + pos for pos in chunk_low)
+                metrics.merge(worker_metrics)
+                done += len(chunk_results)
+                if progress_callback:
+                    progress_callback(done, total)
+
+    # Fallback Rate = section_fallbacks / resumes_parsed
+    metrics.count("resumes_parsed", total, stage="parse")
+    unsettled, errors = set(low_confidence), []
+    if deferred:
+        metrics.count("section_fallbacks", len(deferred), stage="parse")
+        # Replies are cached per PDF and parser version, since the indices refer to this version's lines
+        hashes = hashes or [pdf_hash(pdf_bytes) for pdf_bytes in list_of_bytes]
+        cache_ids = [f"{hashes[pos]}:{PARSER_VERSION}" for pos, _, _ in deferred]
+        fallback_results, applied, errors = parse_low_confidence([lines for _, lines, _ in deferred], [limit for _, _, limit in deferred],
+                                                                 cache_ids, fallback_workers, use_cache)
+        for (pos, _, _), result, ok in zip(deferred, fallback_results, applied):
+            results[pos] = result
+            if ok:
+                unsettled.discard(pos)
+    if stats is not None:
+        stats["low_confidence"] = stats.get("low_confidence", 0) + len(low_confidence)
+        stats["llm_sections"] = stats.get("llm_sections", 0) + len(low_confidence) - len(unsettled)
+        stats["fallback_errors"] = stats.get("fallback_errors", 0) + len(errors)
+        if errors:
+            stats["fallback_error"] = errors[-1]
+    if provisional is not None:
+        provisional.extend(sorted(unsettled))
+
+    return results
@@ -0,0 +1,87 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+from cache import CACHE_DIR
+
+# Content Hash of the Uploaded PDF
+def pdf_hash(pdf_bytes):
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+# Persistent Store of Parsed Resumes Keyed by PDF Hash and Parser Version
+class ResumeStore:
+    def __init__(self, parser_version, path=None):
+        self.parser_version = str(parser_version)
+        self.path = path or os.path.join(CACHE_DIR, "resumes.sqlite3")
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS resumes (
+                    sha256 TEXT PRIMARY KEY,
+                    parser_version TEXT NOT NULL,
+                    intro TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get_many(self, hashes):
+        hashes = list(dict.fromkeys(hashes))
+        if not hashes:
+            return {}
+
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT sha256, intro, body FROM resumes WHERE parser_version = ? AND sha256 IN ({placeholders})",
+                    [self.parser_version, *chunk],
+                ).fetchall()
+                for sha256, intro, body in rows:
+                    found[sha256] = (json.loads(intro), json.loads(body))
+        return found
+
+    def get(self, sha256):
+        return self.get_many([sha256]).get(sha256)
+
+    def put_many(self, items):
+        now = time.time()
+        rows = [
+            (sha256, self.parser_version, json.dumps(intro), json.dumps(body), now)
+            for sha256, (intro, body) in items
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO resumes (sha256, parser_version, intro, body, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            # Entries from older parser versions can never be served again
+            conn.execute("DELETE FROM resumes WHERE parser_version != ?", (self.parser_version,))
+            conn.commit()
+
+    def put(self, sha256, intro, body):
+        self.put_many([(sha256, (intro, body))])
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM resumes")
+            conn.commit()
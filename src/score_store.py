@@ -0,0 +1,102 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import Counter
+
+from cache import CACHE_DIR
+
+# Words, Numbers and Terms Like c++, node.js, ci/cd or 5+; Markdown, Bullets, Quotes and Spacing Are Ignored
+CONTENT_TOKEN_RE = re.compile(r"\w[\w+#%$./-]*")
+
+def content_tokens(text):
+    if not isinstance(text, str):
+        return []
+    return [token.rstrip(".,;:/-") for token in CONTENT_TOKEN_RE.findall(text.lower())]
+
+# Same Fingerprint for Texts That Differ Only Cosmetically
+def text_fingerprint(text):
+    return hashlib.sha256(" ".join(content_tokens(text)).encode("utf-8")).hexdigest()
+
+# Words Added and Removed Between Two Versions, for Showing What an Edit Changed
+def content_diff(old, new):
+    old_counts, new_counts = Counter(content_tokens(old)), Counter(content_tokens(new))
+    return sorted((new_counts - old_counts).elements()), sorted((old_counts - new_counts).elements())
+
+# Persistent Scores Keyed by JD Fingerprint, Candidate Fingerprint and Scoring Mode
+# Other per-(JD, candidate) results, like interview questions, live in their own table of the same file
+class ScoreStore:
+    def __init__(self, path=None, table="scores"):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.path = path or os.path.join(CACHE_DIR, "scores.sqlite3")
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    jd_fingerprint TEXT NOT NULL,
+                    candidate_fingerprint TEXT NOT NULL,
+                    mode TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (jd_fingerprint, candidate_fingerprint, mode)
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get_many(self, jd_fingerprint, candidate_fingerprints, mode):
+        fingerprints = list(dict.fromkeys(candidate_fingerprints))
+        if not fingerprints:
+            return {}
+
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(fingerprints), 500):
+                chunk = fingerprints[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT candidate_fingerprint, result FROM {self.table} WHERE jd_fingerprint = ? AND mode = ? "
+                    f"AND candidate_fingerprint IN ({placeholders})",
+                    [jd_fingerprint, mode, *chunk],
+                ).fetchall()
+                for candidate_fingerprint, result in rows:
+                    found[candidate_fingerprint] = json.loads(result)
+        return found
+
+    def put_many(self, jd_fingerprint, mode, items):
+        now = time.time()
+        rows = [
+            (jd_fingerprint, candidate_fingerprint, mode, json.dumps(result), now)
+            for candidate_fingerprint, result in items
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (jd_fingerprint, candidate_fingerprint, mode, result, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+
+    def put(self, jd_fingerprint, candidate_fingerprint, mode, result):
+        self.put_many(jd_fingerprint, mode, [(candidate_fingerprint, result)])
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
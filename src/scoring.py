@@ -0,0 +1,167 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+import agents
+import metrics
+from prompts import compact_resume
+from rate_limit import estimate_tokens, is_transient
+
+# Default Engine Settings
+DEFAULT_WORKERS = 8
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 1.0
+
+# Batched Screening: Candidates per Call, Capped by Their Combined Resume Tokens
+DEFAULT_BATCH_SIZE = 1
+DEFAULT_BATCH_TOKENS = 4000
+
+# Retry a Call with Exponential Backoff
+# The timeout is handed to the agent, which puts it on the HTTP request, so it only starts once the rate limiter lets the call through
+# Only timeouts, connection failures and malformed replies are retried here; 429s and 5xxs were already retried by
+# the rate limiter's backoff, and anything else (bad key, bad request, a bug) fails the same way every time
+def call_with_retry(fn, *args, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, **kwargs):
+    attempt = 0
+    while True:
+        try:
+            return fn(*args, timeout=timeout, **kwargs)
+        except Exception as e:
+            if not (is_transient(e) or isinstance(e, agents.MalformedReply)) or attempt >= retries:
+                raise
+            time.sleep(backoff * (2 ** attempt))
+            attempt += 1
+
+# Score a Single Candidate and Capture the Error Instead of Raising
+def _score_one(key, job_description, candidate_resume, timeout, retries, backoff, use_cache, structured):
+    start = time.perf_counter()
+    agent = agents.resume_screening_agent_structured if structured else agents.resume_screening_agent
+    try:
+        result = call_with_retry(
+            agent,
+            job_description,
+            candidate_resume,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            use_cache=use_cache,
+        )
+        error = None
+    except Exception as e:
+        result, error = None, e
+    return {
+        "key": key,
+        "result": result,
+        "error": error,
+        "elapsed": time.perf_counter() - start,
+    }
+
+# Group Candidates in Order, Closing a Batch at batch_size or Once the Token Budget Would Be Exceeded
+def plan_batches(candidates, batch_size=DEFAULT_BATCH_SIZE, batch_tokens=DEFAULT_BATCH_TOKENS):
+    batches, batch, used = [], [], 0
+    for key, resume in candidates:
+        tokens = estimate_tokens(compact_resume(resume))
+        if batch and (len(batch) >= batch_size or used + tokens > batch_tokens):
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append((key, resume))
+        used += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+# Score One Batch in a Single Call, Then Fall Back to Single Calls for Entries It Lacks
+def _score_batch(batch, job_description, timeout, retries, backoff, use_cache):
+    if len(batch) == 1:
+        key, resume = batch[0]
+        return [_score_one(key, job_description, resume, timeout, retries, backoff, use_cache, True)]
+
+    start = time.perf_counter()
+    ids = {str(key): (key, resume) for key, resume in batch}
+    try:
+        scores = call_with_retry(
+            agents.resume_screening_agent_batch,
+            job_description,
+            [(candidate_id, resume) for candidate_id, (_, resume) in ids.items()],
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            use_cache=use_cache,
+        )
+    except Exception:
+        scores = {}
+    elapsed = time.perf_counter() - start
+
+    results = []
+    for candidate_id, (key, resume) in ids.items():
+        if candidate_id in scores:
+            results.append({"key": key, "result": scores[candidate_id], "error": None, "elapsed": elapsed})
+        else:
+            metrics.count("batch_fallbacks", stage="resume_screening_batch")
+            results.append(_score_one(key, job_description, resume, timeout, retries, backoff, use_cache, True))
+    return results
+
+# Score Many Candidates Concurrently, Yielding Each Result as Soon as It Finishes
+def score_candidates(job_description, candidates, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT,
+                     retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, use_cache=True, structured=False,
+                     batch_size=DEFAULT_BATCH_SIZE, batch_tokens=DEFAULT_BATCH_TOKENS):
+    # candidates: iterable of (key, candidate_resume) pairs
+    candidates = list(candidates)
+    if not candidates:
+        return
+
+    # Batching needs the JSON reply of structured mode, and distinct IDs to match entries back
+    keys = [str(key) for key, _ in candidates]
+    if structured and batch_size > 1 and len(set(keys)) == len(keys):
+        batches = plan_batches(candidates, batch_size, batch_tokens)
+    else:
+        batches = None
+
+    workers = max(1, min(int(workers), len(batches or candidates)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scoring") as executor:
+        if batches is not None:
+            futures = [
+                executor.submit(_score_batch, batch, job_description, timeout, retries, backoff, use_cache)
+                for batch in batches
+            ]
+        else:
+            futures = [
+                executor.submit(_score_one, key, job_description, resume, timeout, retries, backoff, use_cache, structured)
+                for key, resume in candidates
+            ]
+        try:
+            for future in as_completed(futures):
+                if batches is not None:
+                    yield from future.result()
+                else:
+                    yield future.result()
+        finally:
+            # Stop queued work if the consumer goes away (e.g. a Streamlit rerun)
+            for future in futures:
+                future.cancel()
+
+# Sortable Leaderboard of Structured Scores, Indexed by Candidate Key (the Stable Candidate ID in the App)
+# Names are only a column: two candidates can share one
+LEADERBOARD_COLUMNS = ["name", "score", "recommendation", "strengths", "weaknesses"]
+
+def leaderboard(scored, names=None):
+    names = names or {}
+    rows = []
+    for item in scored:
+        result = item["result"]
+        if item["error"] is not None or not isinstance(result, dict):
+            continue
+        rows.append({
+            "candidate": item["key"],
+            "name": names.get(item["key"], item["key"]),
+            "score": result["score"],
+            "recommendation": result["recommendation"],
+            "strengths": "; ".join(result["strengths"]),
+            "weaknesses": "; ".join(result["weaknesses"]),
+        })
+
+    if not rows:
+        return pd.DataFrame(columns=LEADERBOARD_COLUMNS).rename_axis("candidate")
+    board = pd.DataFrame(rows).set_index("candidate")
+    return board.sort_values("score", ascending=False, kind="stable")
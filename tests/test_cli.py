@@ -0,0 +1,58 @@
+import os
+import sys
+import json
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from cli import FIELDS, completed_files, drop_torn_tail, write_records
+
+def make_record(i):
+    record = {field: None for field in FIELDS}
+    record.update(file=f"cv{i:02d}.pdf", sha256=f"{i:064x}", name=f"Candidate {i}", Experience="Engineer at A\nBuilt APIs")
+    return record
+
+# An Interrupted Run Leaves Part of the Last Record; the Next Run Redoes It on a Fresh Line
+@pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+@pytest.mark.parametrize("keep", [0.5, 0.0])
+def test_resume_after_torn_write(tmp_path, fmt, keep):
+    path = str(tmp_path / f"out.{fmt}")
+    write_records(path, fmt, [make_record(i) for i in range(8)])
+    with open(path, "rb") as f:
+        data = f.read()
+    # Tear the last record, keeping `keep` of it, or just its terminator
+    last = data.rstrip(b"\r\n").rfind(b"\n") + 1
+    cut = last + int((len(data) - last) * keep) if keep else len(data) - 1
+    with open(path, "wb") as f:
+        f.write(data[:cut])
+
+    done = completed_files(path, fmt)
+    assert done == {f"cv{i:02d}.pdf" for i in range(7)}
+
+    write_records(path, fmt, [make_record(i) for i in range(8) if f"cv{i:02d}.pdf" not in done])
+    assert completed_files(path, fmt) == {f"cv{i:02d}.pdf" for i in range(8)}
+    if fmt == "jsonl":
+        with open(path, encoding="utf-8") as f:
+            assert [json.loads(line)["file"] for line in f] == [f"cv{i:02d}.pdf" for i in range(8)]
+    else:
+        with open(path, "rb") as f:
+            assert f.read() == data
+
+def test_torn_header_only_csv_is_rewritten(tmp_path):
+    path = str(tmp_path / "out.csv")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("file,sha")
+    assert completed_files(path, "csv") == set()
+    write_records(path, "csv", [make_record(0)])
+    assert completed_files(path, "csv") == {"cv00.pdf"}
+
+# A \r\n Split Across Two Read Blocks Still Counts as the End of a Record
+@pytest.mark.parametrize("block", [2, 3, 5, 1 << 16])
+def test_drop_torn_tail_across_blocks(tmp_path, block):
+    path = str(tmp_path / "out.csv")
+    with open(path, "wb") as f:
+        f.write(b"a,b\r\n1,x\ny\r\n2,par")
+    drop_torn_tail(path, "csv", block=block)
+    with open(path, "rb") as f:
+        assert f.read() == b"a,b\r\n1,x\ny\r\n"